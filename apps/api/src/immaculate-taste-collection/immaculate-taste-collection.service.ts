@@ -32,7 +32,20 @@ const asInt = (value: unknown): number | null => {
   return parsed === null ? null : Math.trunc(parsed);
 };
 
+// The legacy points file is a one-time migration input: it is either present when
+// the app starts or never. Remember each probe so every empty library dataset
+// doesn't repeat the filesystem walk below.
+const legacyPointsPathCache = new Map<string, string | null>();
+
 const resolveLegacyPointsPath = (fileName: string): string | null => {
+  const cached = legacyPointsPathCache.get(fileName);
+  if (cached !== undefined) return cached;
+  const resolved = findLegacyPointsPath(fileName);
+  legacyPointsPathCache.set(fileName, resolved);
+  return resolved;
+};
+
+const findLegacyPointsPath = (fileName: string): string | null => {
   // Prefer APP_DATA_DIR (same place tcp.sqlite lives)
   const appDataDir = process.env['APP_DATA_DIR'];
   if (appDataDir) {
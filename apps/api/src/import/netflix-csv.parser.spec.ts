@@ -148,6 +148,13 @@ describe('netflix-csv.parser', () => {
       );
       expect(entries[0].parsedTitle).toBe('Love, Death & Robots');
     });
+
+    it('cuts at the highest-priority TV pattern, not the leftmost one', () => {
+      const { entries } = parseNetflixCsv(
+        csv(['Title,Date', 'Saga: Part One: Season 2: Episode 3,5/20/22']),
+      );
+      expect(entries[0].parsedTitle).toBe('Saga: Part One');
+    });
   });
 
   describe('detectDateFormat', () => {
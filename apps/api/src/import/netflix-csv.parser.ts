@@ -4,16 +4,23 @@ export type ParsedNetflixEntry = {
   watchedAt: Date | null;
 };
 
-const TV_PATTERNS = [
-  /:\s*Season\b/i,
-  /:\s*Limited Series\b/i,
-  /:\s*Part\b/i,
-  /:\s*Episode\b/i,
-  /:\s*Chapter\b/i,
-  /:\s*Volume\b/i,
-  /:\s*Series\b/i,
-  /:\s*Collection\b/i,
+// Suffix keywords that mark a TV title, in priority order: when several appear,
+// the title is cut at the highest-priority one. All of them are matched in a
+// single scan instead of one regex search per keyword.
+const TV_KEYWORDS = [
+  'season',
+  'limited series',
+  'part',
+  'episode',
+  'chapter',
+  'volume',
+  'series',
+  'collection',
 ];
+const TV_KEYWORD_RANK = new Map<string, number>(
+  TV_KEYWORDS.map((keyword, rank) => [keyword, rank]),
+);
+const TV_PATTERN_RE = new RegExp(`:\\s*(${TV_KEYWORDS.join('|')})\\b`, 'gi');
 
 function stripBom(text: string): string {
   if (text.charCodeAt(0) === 0xfeff) return text.slice(1);
@@ -21,11 +28,18 @@ function stripBom(text: string): string {
 }
 
 function stripTvPatterns(title: string): string {
-  for (const pattern of TV_PATTERNS) {
-    const match = title.search(pattern);
-    if (match !== -1) return title.slice(0, match).trim();
+  let cut = -1;
+  let bestRank = TV_KEYWORDS.length;
+  for (const match of title.matchAll(TV_PATTERN_RE)) {
+    const rank = TV_KEYWORD_RANK.get((match[1] ?? '').toLowerCase());
+    if (rank === undefined || rank >= bestRank || match.index === undefined) {
+      continue;
+    }
+    bestRank = rank;
+    cut = match.index;
+    if (rank === 0) break;
   }
-  return title.trim();
+  return (cut === -1 ? title : title.slice(0, cut)).trim();
 }
 
 export type DateFormat = 'mdy' | 'dmy';
@@ -80,28 +94,33 @@ function parseCsvLine(line: unknown): string[] {
   const fields: string[] = [];
   let current = '';
   let inQuotes = false;
+  // Ordinary characters are copied in runs with one slice each instead of being
+  // appended one at a time; runStart marks where the pending run begins.
+  let runStart = 0;
 
   for (let i = 0; i < safeLine.length; i++) {
     const ch = safeLine[i];
     if (inQuotes) {
-      if (ch === '"' && safeLine[i + 1] === '"') {
+      if (ch !== '"') continue;
+      current += safeLine.slice(runStart, i);
+      if (safeLine[i + 1] === '"') {
         current += '"';
         i++;
-      } else if (ch === '"') {
-        inQuotes = false;
       } else {
-        current += ch;
+        inQuotes = false;
       }
+      runStart = i + 1;
     } else if (ch === '"') {
+      current += safeLine.slice(runStart, i);
       inQuotes = true;
+      runStart = i + 1;
     } else if (ch === ',') {
-      fields.push(current);
+      fields.push(current + safeLine.slice(runStart, i));
       current = '';
-    } else {
-      current += ch;
+      runStart = i + 1;
     }
   }
-  fields.push(current);
+  fields.push(current + safeLine.slice(runStart));
   return fields;
 }
 
@@ -128,16 +147,17 @@ export function parseNetflixCsv(buffer: Buffer): ParseNetflixCsvResult {
     throw new Error('CSV is missing the required "Title" column header');
   }
 
-  const dataLines = lines.slice(1);
+  // Parse each row once; the date format has to be detected from all rows before
+  // any date can be read, so the fields are kept for the second pass.
+  const rows = lines.slice(1).map((line) => parseCsvLine(line));
   const dateValues =
     dateIdx >= 0
-      ? dataLines.map((l) => parseCsvLine(l)[dateIdx] ?? '').filter(Boolean)
+      ? rows.map((fields) => fields[dateIdx] ?? '').filter(Boolean)
       : [];
   const format = detectDateFormat(dateValues);
 
   const raw: ParsedNetflixEntry[] = [];
-  for (const line of dataLines) {
-    const fields = parseCsvLine(line);
+  for (const fields of rows) {
     const rawTitle = (fields[titleIdx] ?? '').trim();
     if (!rawTitle) continue;
 
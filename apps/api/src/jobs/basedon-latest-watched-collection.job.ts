@@ -11,7 +11,10 @@ import { SeerrService } from '../seerr/seerr.service';
 import { WatchedCollectionsRefresherService } from '../watched-movie-recommendations/watched-collections-refresher.service';
 import { normalizeTitleForMatching } from '../lib/title-normalize';
 import { resolvePlexLibrarySelection } from '../plex/plex-library-selection.utils';
-import { isPlexUserExcludedFromMonitoring } from '../plex/plex-user-selection.utils';
+import {
+  isPlexAdminUser,
+  isPlexUserExcludedFromMonitoring,
+} from '../plex/plex-user-selection.utils';
 import {
   CHANGE_OF_MOVIE_TASTE_COLLECTION_BASE_NAME,
   CHANGE_OF_SHOW_TASTE_COLLECTION_BASE_NAME,
@@ -848,14 +851,11 @@ export class BasedonLatestWatchedCollectionJob {
       radarr,
     } = params;
 
+    // One record (one jobLogLine insert) for the run header, sample included.
     await ctx.info('collection_run: start', {
       collectionName,
       recommendationStrategy,
       generated: recommendationTitles.length,
-    });
-
-    await ctx.info('collection_run: recommendations sample', {
-      collectionName,
       sample: recommendationTitles.slice(0, 10),
     });
 
@@ -2032,14 +2032,11 @@ export class BasedonLatestWatchedCollectionJob {
       sonarrTvdbLookupCache,
     } = params;
 
+    // One record (one jobLogLine insert) for the run header, sample included.
     await ctx.info('collection_run(tv): start', {
       collectionName,
       recommendationStrategy,
       generated: recommendationTitles.length,
-    });
-
-    await ctx.info('collection_run(tv): recommendations sample', {
-      collectionName,
       sample: recommendationTitles.slice(0, 10),
     });
 
@@ -2659,34 +2656,11 @@ export class BasedonLatestWatchedCollectionJob {
     const fromInput = plexUserIdRaw
       ? await this.plexUsers.getPlexUserById(plexUserIdRaw)
       : null;
-    const normalize = (value: string | null | undefined) =>
-      String(value ?? '')
-        .trim()
-        .toLowerCase();
-    const isAdminUser = (row: {
-      id: string;
-      plexAccountId: number | null;
-      plexAccountTitle: string;
-      isAdmin?: boolean;
-    }) => {
-      if (row.id === admin.id) return true;
-      if (
-        row.plexAccountId !== null &&
-        admin.plexAccountId !== null &&
-        row.plexAccountId === admin.plexAccountId
-      ) {
-        return true;
-      }
-      const rowTitle = normalize(row.plexAccountTitle);
-      const adminTitle = normalize(admin.plexAccountTitle);
-      if (rowTitle && adminTitle && rowTitle === adminTitle) return true;
-      return row.isAdmin === true;
-    };
     if (fromInput) {
       return {
         plexUserId: fromInput.id,
         plexUserTitle: fromInput.plexAccountTitle,
-        pinCollections: isAdminUser(fromInput),
+        pinCollections: isPlexAdminUser(fromInput, admin),
       };
     }
 
@@ -2698,7 +2672,7 @@ export class BasedonLatestWatchedCollectionJob {
         return {
           plexUserId: byTitle.id,
           plexUserTitle: byTitle.plexAccountTitle,
-          pinCollections: isAdminUser(byTitle),
+          pinCollections: isPlexAdminUser(byTitle, admin),
         };
       }
     }
@@ -2712,7 +2686,7 @@ export class BasedonLatestWatchedCollectionJob {
         return {
           plexUserId: byAccount.id,
           plexUserTitle: byAccount.plexAccountTitle,
-          pinCollections: isAdminUser(byAccount),
+          pinCollections: isPlexAdminUser(byAccount, admin),
         };
       }
     }
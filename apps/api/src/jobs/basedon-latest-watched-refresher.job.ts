@@ -25,6 +25,7 @@ import {
   sortSweepUsers,
 } from './refresher-sweep.utils';
 import {
+  isPlexAdminUser,
   isPlexUserExcludedFromMonitoring,
   resolvePlexUserMonitoringSelection,
 } from '../plex/plex-user-selection.utils';
@@ -534,29 +535,6 @@ export class BasedonLatestWatchedRefresherJob {
     const admin = await this.plexUsers.ensureAdminPlexUser({
       userId: ctx.userId,
     });
-    const normalize = (value: string | null | undefined) =>
-      String(value ?? '')
-        .trim()
-        .toLowerCase();
-    const isAdminUser = (user: {
-      id: string;
-      plexAccountId: number | null;
-      plexAccountTitle: string;
-      isAdmin: boolean;
-    }) => {
-      if (user.id === admin.id) return true;
-      if (
-        user.plexAccountId !== null &&
-        admin.plexAccountId !== null &&
-        user.plexAccountId === admin.plexAccountId
-      ) {
-        return true;
-      }
-      const userTitle = normalize(user.plexAccountTitle);
-      const adminTitle = normalize(admin.plexAccountTitle);
-      if (userTitle && adminTitle && userTitle === adminTitle) return true;
-      return user.isAdmin;
-    };
 
     await ctx.info('recentlyWatchedRefresher: sweep start', {
       mode: 'sweep',
@@ -566,7 +544,7 @@ export class BasedonLatestWatchedRefresherJob {
       usersSelected: orderedUsers.map((u) => ({
         plexUserId: u.id,
         plexUserTitle: u.plexAccountTitle,
-        isAdmin: isAdminUser(u),
+        isAdmin: isPlexAdminUser(u, admin),
       })),
       usersSkippedByMonitoring: usersExcludedByMonitoring.map((u) => ({
         plexUserId: u.id,
@@ -583,7 +561,7 @@ export class BasedonLatestWatchedRefresherJob {
     let usersSkipped = 0;
 
     for (const user of orderedUsers) {
-      const userIsAdmin = isAdminUser(user);
+      const userIsAdmin = isPlexAdminUser(user, admin);
       const pinTarget: 'admin' | 'friends' = userIsAdmin ? 'admin' : 'friends';
 
       const movieLibraryRows = includeMovies
@@ -756,34 +734,11 @@ export class BasedonLatestWatchedRefresherJob {
     const fromInput = plexUserIdRaw
       ? await this.plexUsers.getPlexUserById(plexUserIdRaw)
       : null;
-    const normalize = (value: string | null | undefined) =>
-      String(value ?? '')
-        .trim()
-        .toLowerCase();
-    const isAdminUser = (row: {
-      id: string;
-      plexAccountId: number | null;
-      plexAccountTitle: string;
-      isAdmin?: boolean;
-    }) => {
-      if (row.id === admin.id) return true;
-      if (
-        row.plexAccountId !== null &&
-        admin.plexAccountId !== null &&
-        row.plexAccountId === admin.plexAccountId
-      ) {
-        return true;
-      }
-      const rowTitle = normalize(row.plexAccountTitle);
-      const adminTitle = normalize(admin.plexAccountTitle);
-      if (rowTitle && adminTitle && rowTitle === adminTitle) return true;
-      return row.isAdmin === true;
-    };
     if (fromInput) {
       return {
         plexUserId: fromInput.id,
         plexUserTitle: fromInput.plexAccountTitle,
-        pinCollections: isAdminUser(fromInput),
+        pinCollections: isPlexAdminUser(fromInput, admin),
       };
     }
 
@@ -795,7 +750,7 @@ export class BasedonLatestWatchedRefresherJob {
         return {
           plexUserId: byTitle.id,
           plexUserTitle: byTitle.plexAccountTitle,
-          pinCollections: isAdminUser(byTitle),
+          pinCollections: isPlexAdminUser(byTitle, admin),
         };
       }
     }
@@ -809,7 +764,7 @@ export class BasedonLatestWatchedRefresherJob {
         return {
           plexUserId: byAccount.id,
           plexUserTitle: byAccount.plexAccountTitle,
-          pinCollections: isAdminUser(byAccount),
+          pinCollections: isPlexAdminUser(byAccount, admin),
         };
       }
     }
@@ -1,16 +1,23 @@
-import { CleanupAfterAddingNewContentJob } from './cleanup-after-adding-new-content.job';
+import {
+  CleanupAfterAddingNewContentJob,
+  parseSeasonTitleFallback,
+  setSonarrEpisodesMonitored,
+} from './cleanup-after-adding-new-content.job';
 import type { JobContext, JsonObject } from './jobs.types';
 import { SettingsService } from '../settings/settings.service';
 import { PlexServerService } from '../plex/plex-server.service';
 import { PlexWatchlistService } from '../plex/plex-watchlist.service';
 import { PlexDuplicatesService } from '../plex/plex-duplicates.service';
 import { RadarrService } from '../radarr/radarr.service';
-import { SonarrService } from '../sonarr/sonarr.service';
+import { SonarrHttpError, SonarrService } from '../sonarr/sonarr.service';
 
 type SettingsMock = Pick<SettingsService, 'getInternalSettings'>;
 type PlexServerMock = Pick<PlexServerService, 'getSections'>;
 type RadarrMock = Pick<RadarrService, 'listMovies'>;
-type SonarrMock = Pick<SonarrService, 'listSeries'>;
+type SonarrMock = Pick<
+  SonarrService,
+  'listSeries' | 'setEpisodesMonitored' | 'setEpisodeMonitored'
+>;
 
 function createContext(input: JsonObject): JobContext {
   let currentSummary: JsonObject | null = null;
@@ -52,6 +59,8 @@ function createJob() {
   };
   const sonarr: jest.Mocked<SonarrMock> = {
     listSeries: jest.fn(),
+    setEpisodesMonitored: jest.fn(),
+    setEpisodeMonitored: jest.fn(),
   };
 
   const job = new CleanupAfterAddingNewContentJob(
@@ -171,4 +180,66 @@ describe('CleanupAfterAddingNewContentJob', () => {
     expect(radarr.listMovies).not.toHaveBeenCalled();
     expect(sonarr.listSeries).not.toHaveBeenCalled();
   });
+
+  it('falls back to per-episode Sonarr updates only when the bulk endpoint is rejected', async () => {
+    const { sonarr } = createJob();
+    const ctx = createContext({});
+    const params = {
+      sonarr,
+      ctx,
+      baseUrl: 'http://sonarr:8989',
+      apiKey: 'key',
+      monitored: false,
+    };
+    const rows = [
+      { ep: { id: 1 }, key: 'S01E01' },
+      { ep: { id: 2 }, key: 'S01E02' },
+    ];
+
+    sonarr.setEpisodesMonitored.mockRejectedValueOnce(
+      new SonarrHttpError('Sonarr bulk update episodes failed: HTTP 404', 404),
+    );
+    sonarr.setEpisodeMonitored.mockResolvedValue(true);
+    await expect(
+      setSonarrEpisodesMonitored({ ...params, rows }),
+    ).resolves.toEqual({ updated: 2, failed: [] });
+    expect(sonarr.setEpisodeMonitored).toHaveBeenCalledTimes(2);
+
+    sonarr.setEpisodeMonitored.mockClear();
+    sonarr.setEpisodesMonitored.mockRejectedValueOnce(
+      new Error('This operation was aborted'),
+    );
+    const res = await setSonarrEpisodesMonitored({ ...params, rows });
+    expect(res.updated).toBe(0);
+    expect(res.failed.map((f) => f.key)).toEqual(['S01E01', 'S01E02']);
+    expect(sonarr.setEpisodeMonitored).not.toHaveBeenCalled();
+    expect(ctx.warn).toHaveBeenCalledWith(
+      'sonarr: bulk episode monitor update failed',
+      expect.objectContaining({ fallback: 'none' }),
+    );
+  });
+});
+
+describe('parseSeasonTitleFallback', () => {
+  it('reads the series title and the first season number', () => {
+    expect(parseSeasonTitleFallback('Show Name - Season 3')).toEqual({
+      seriesTitle: 'Show Name',
+      seasonNumber: 3,
+    });
+    expect(parseSeasonTitleFallback('Show Name - Season Finale')).toEqual({
+      seriesTitle: 'Show Name',
+      seasonNumber: null,
+    });
+    expect(parseSeasonTitleFallback('Show Name')).toEqual({
+      seriesTitle: null,
+      seasonNumber: null,
+    });
+  });
+
+  it('does not take a season number from past a second separator', () => {
+    expect(parseSeasonTitleFallback('X - Season  - Season 2')).toEqual({
+      seriesTitle: 'X',
+      seasonNumber: null,
+    });
+  });
 });
@@ -8,6 +8,7 @@ import {
 } from '../plex/plex-duplicates.service';
 import { RadarrService, type RadarrMovie } from '../radarr/radarr.service';
 import {
+  SonarrHttpError,
   SonarrService,
   type SonarrEpisode,
   type SonarrSeries,
@@ -74,38 +75,103 @@ function normalizeHttpUrl(raw: string): string {
   return /^https?:\/\//i.test(trimmed) ? trimmed : `http://${trimmed}`;
 }
 
+const NON_ALNUM_RE = /[^a-z0-9]/g;
+
 function normTitle(s: string): string {
-  return (s ?? '')
-    .toLowerCase()
-    .split('')
-    .filter((ch) => /[a-z0-9]/.test(ch))
-    .join('');
+  return (s ?? '').toLowerCase().replace(NON_ALNUM_RE, '');
+}
+
+function bigramCounts(s: string): Map<string, number> {
+  const map = new Map<string, number>();
+  for (let i = 0; i < s.length - 1; i += 1) {
+    const bg = s.slice(i, i + 2);
+    map.set(bg, (map.get(bg) ?? 0) + 1);
+  }
+  return map;
 }
 
-function diceCoefficient(a: string, b: string): number {
-  const s1 = normTitle(a);
-  const s2 = normTitle(b);
-  if (!s1 || !s2) return 0;
-  if (s1 === s2) return 1;
-  if (s1.length < 2 || s2.length < 2) return 0;
-
-  const bigrams = (s: string) => {
-    const map = new Map<string, number>();
-    for (let i = 0; i < s.length - 1; i += 1) {
-      const bg = s.slice(i, i + 2);
-      map.set(bg, (map.get(bg) ?? 0) + 1);
+// Query-side work is done once per fuzzy scan; `floor` skips candidates whose
+// length difference alone caps their score at or below the current best.
+function diceScorer(
+  query: string,
+): (candidate: string, floor?: number) => number {
+  const s1 = normTitle(query);
+  const m1 = s1.length >= 2 ? bigramCounts(s1) : null;
+  return (candidate, floor = -1) => {
+    const s2 = normTitle(candidate);
+    if (!s1 || !s2) return 0;
+    if (s1 === s2) return 1;
+    if (!m1 || s2.length < 2) return 0;
+
+    const n1 = s1.length - 1;
+    const n2 = s2.length - 1;
+    if ((2 * Math.min(n1, n2)) / (n1 + n2) <= floor) return 0;
+
+    const m2 = bigramCounts(s2);
+    let intersection = 0;
+    for (const [bg, c1] of m1.entries()) {
+      const c2 = m2.get(bg) ?? 0;
+      intersection += Math.min(c1, c2);
     }
-    return map;
+    return (2 * intersection) / (n1 + n2);
   };
+}
+
+type TitleIndex<T> = {
+  byLower: Map<string, T>;
+  byNorm: Map<string, T>;
+};
+
+// Indexes are keyed by the list instance so repeated lookups against the same
+// Radarr/Sonarr response reuse the build cost instead of re-scanning the list.
+const titleIndexCache = new WeakMap<object, TitleIndex<unknown>>();
+
+function getTitleIndex<T extends { title?: string }>(
+  items: readonly T[],
+): TitleIndex<T> {
+  const cached = titleIndexCache.get(items);
+  if (cached) return cached as TitleIndex<T>;
+
+  const byLower = new Map<string, T>();
+  const byNorm = new Map<string, T>();
+  for (const it of items) {
+    const t = typeof it.title === 'string' ? it.title : '';
+    if (!t) continue;
+    // First entry wins, matching the previous Array.find semantics.
+    const lower = t.toLowerCase();
+    if (!byLower.has(lower)) byLower.set(lower, it);
+    const norm = normTitle(t);
+    if (norm && !byNorm.has(norm)) byNorm.set(norm, it);
+  }
+
+  const index: TitleIndex<T> = { byLower, byNorm };
+  titleIndexCache.set(items, index);
+  return index;
+}
 
-  const m1 = bigrams(s1);
-  const m2 = bigrams(s2);
-  let intersection = 0;
-  for (const [bg, c1] of m1.entries()) {
-    const c2 = m2.get(bg) ?? 0;
-    intersection += Math.min(c1, c2);
+// How long a resolved title/TVDB -> ARR id mapping is reused across runs.
+const ARR_ID_CACHE_TTL_MS = 60 * 60_000;
+
+function readArrIdCache(
+  cache: Map<string, { id: number; expiresAt: number }>,
+  key: string,
+): number | null {
+  const hit = cache.get(key);
+  if (!hit) return null;
+  if (hit.expiresAt <= Date.now()) {
+    cache.delete(key);
+    return null;
   }
-  return (2 * intersection) / (s1.length - 1 + (s2.length - 1));
+  return hit.id;
+}
+
+function writeArrIdCache(
+  cache: Map<string, { id: number; expiresAt: number }>,
+  key: string,
+  id: number,
+) {
+  if (!Number.isFinite(id) || id <= 0) return;
+  cache.set(key, { id, expiresAt: Date.now() + ARR_ID_CACHE_TTL_MS });
 }
 
 function toInt(value: unknown): number | null {
@@ -119,19 +185,20 @@ function episodeKey(season: number, episode: number) {
   return `${season}:${episode}`;
 }
 
-function parseSeasonTitleFallback(title: string): {
+// "Series Name - Season X": series title up to the first " - Season ", then the first
+// number after it, but not past a second " - Season ".
+const SEASON_TITLE_RE = /^([\s\S]*?) - Season (?:(?:(?! - Season )\D)*(\d+))?/;
+
+export function parseSeasonTitleFallback(title: string): {
   seriesTitle: string | null;
   seasonNumber: number | null;
 } {
   // Match Python expectation: "Series Name - Season X"
   const raw = title.trim();
-  if (!raw) return { seriesTitle: null, seasonNumber: null };
-  if (!raw.includes(' - Season '))
-    return { seriesTitle: null, seasonNumber: null };
-  const [seriesTitleRaw, seasonPartRaw] = raw.split(' - Season ', 2);
-  const seriesTitle = seriesTitleRaw.trim() || null;
-  const match = seasonPartRaw.match(/(\d+)/);
-  const seasonNumber = match ? Number.parseInt(match[1], 10) : null;
+  const match = raw ? SEASON_TITLE_RE.exec(raw) : null;
+  if (!match) return { seriesTitle: null, seasonNumber: null };
+  const seriesTitle = match[1].trim() || null;
+  const seasonNumber = match[2] ? Number.parseInt(match[2], 10) : null;
   return {
     seriesTitle,
     seasonNumber: Number.isFinite(seasonNumber) ? seasonNumber : null,
@@ -183,6 +250,18 @@ function readMediaAddedCleanupFeatures(
 
 @Injectable()
 export class CleanupAfterAddingNewContentJob {
+  // The job is a singleton, so these survive between runs: webhook bursts for the same
+  // show/movie resolve the ARR id from here and fetch just that item instead of the
+  // whole Sonarr/Radarr library. Items are always re-fetched by id, so state stays fresh.
+  private readonly sonarrSeriesIdCache = new Map<
+    string,
+    { id: number; expiresAt: number }
+  >();
+  private readonly radarrMovieIdCache = new Map<
+    string,
+    { id: number; expiresAt: number }
+  >();
+
   constructor(
     private readonly settingsService: SettingsService,
     private readonly plexServer: PlexServerService,
@@ -435,17 +514,36 @@ export class CleanupAfterAddingNewContentJob {
       };
       let plexTvdbRatingKeysForSweep: Map<number, string[]> | null = null;
 
+      // Radarr and Sonarr are independent backends; fetch both indexes concurrently
+      // and fold the results in below in the usual order.
+      const [radarrListResult, sonarrListResult] = await Promise.allSettled([
+        features.unmonitorInArr && radarrBaseUrl && radarrApiKey
+          ? this.radarr.listMovies({
+              baseUrl: radarrBaseUrl,
+              apiKey: radarrApiKey,
+            })
+          : null,
+        sonarrBaseUrl &&
+        sonarrApiKey &&
+        (features.removeFromWatchlist || features.unmonitorInArr)
+          ? this.sonarr.listSeries({
+              baseUrl: sonarrBaseUrl,
+              apiKey: sonarrApiKey,
+            })
+          : null,
+      ]);
+
       // --- Load Radarr index once (best-effort)
-      let radarrMovies: RadarrMovie[] = [];
+      let radarrMovies: readonly RadarrMovie[] = [];
       const radarrByTmdb = new Map<number, RadarrMovie>();
       const radarrByNormTitle = new Map<string, RadarrMovie>();
       let fullSweepRadarrConnected: boolean | null = null;
       if (features.unmonitorInArr && radarrBaseUrl && radarrApiKey) {
         try {
-          radarrMovies = await this.radarr.listMovies({
-            baseUrl: radarrBaseUrl,
-            apiKey: radarrApiKey,
-          });
+          if (radarrListResult.status === 'rejected') {
+            throw radarrListResult.reason;
+          }
+          radarrMovies = radarrListResult.value ?? [];
           fullSweepRadarrConnected = true;
           for (const m of radarrMovies) {
             const tmdb = toInt(m.tmdbId);
@@ -477,10 +575,10 @@ export class CleanupAfterAddingNewContentJob {
         (features.removeFromWatchlist || features.unmonitorInArr)
       ) {
         try {
-          sonarrSeriesList = await this.sonarr.listSeries({
-            baseUrl: sonarrBaseUrl,
-            apiKey: sonarrApiKey,
-          });
+          if (sonarrListResult.status === 'rejected') {
+            throw sonarrListResult.reason;
+          }
+          sonarrSeriesList = sonarrListResult.value ?? [];
           fullSweepSonarrConnected = true;
           for (const s of sonarrSeriesList) {
             const tvdb = toInt(s.tvdbId);
@@ -515,12 +613,14 @@ export class CleanupAfterAddingNewContentJob {
         const exact = sonarrByNormTitle.get(norm);
         if (exact) return exact;
         // Fuzzy fallback
+        const scoreTitle = diceScorer(q);
         let best: { s: SonarrSeries; score: number } | null = null;
         for (const s of sonarrSeriesList) {
           const t = typeof s.title === 'string' ? s.title : '';
           if (!t) continue;
-          const score = diceCoefficient(q, t);
+          const score = scoreTitle(t, best?.score);
           if (!best || score > best.score) best = { s, score };
+          if (best.score === 1) break;
         }
         if (best && best.score >= 0.7) return best.s;
         return null;
@@ -634,19 +734,25 @@ export class CleanupAfterAddingNewContentJob {
             libraries: plexMovieSections.map((s) => s.title),
           });
 
-          for (const sec of plexMovieSections) {
-            try {
-              const items =
-                await this.plexServer.listMoviesWithTmdbIdsForSectionKey({
-                  baseUrl: plexBaseUrl,
-                  token: plexToken,
-                  librarySectionKey: sec.key,
-                  sectionTitle: sec.title,
-                });
-              for (const it of items) {
+          // Sections are independent; list them concurrently and merge in section order.
+          const sectionListings = await Promise.allSettled(
+            plexMovieSections.map((sec) =>
+              this.plexServer.listMoviesWithTmdbIdsForSectionKey({
+                baseUrl: plexBaseUrl,
+                token: plexToken,
+                librarySectionKey: sec.key,
+                sectionTitle: sec.title,
+              }),
+            ),
+          );
+          for (const [i, listing] of sectionListings.entries()) {
+            const sec = plexMovieSections[i];
+            if (listing.status === 'fulfilled') {
+              for (const it of listing.value) {
                 movies.push({ ...it, libraryTitle: sec.title });
               }
-            } catch (err) {
+            } else {
+              const err = listing.reason as unknown;
               const msg = (err as Error)?.message ?? String(err);
               sweepWarnings.push(
                 `plex: failed listing movies for section=${sec.title} (continuing): ${msg}`,
@@ -1891,8 +1997,7 @@ export class CleanupAfterAddingNewContentJob {
 
             // Unmonitor in Radarr (best-effort)
             if (features.unmonitorInArr && radarrBaseUrl && radarrApiKey) {
-              const candidate =
-                radarrByNormTitle.get(normTitle(it.title)) ?? null;
+              const candidate = radarrByNormTitle.get(norm) ?? null;
               if (!candidate) {
                 watchlistStats.movies.radarrNotFound += 1;
               } else if (!candidate.monitored) {
@@ -2326,6 +2431,38 @@ export class CleanupAfterAddingNewContentJob {
       title: string;
     }): Promise<SonarrSeries | null> => {
       if (!sonarrBaseUrl || !sonarrApiKey) return null;
+      const q = params.title.trim();
+      const cacheKeys = [
+        params.tvdbId ? `${sonarrBaseUrl}|tvdb:${params.tvdbId}` : null,
+        q ? `${sonarrBaseUrl}|title:${q.toLowerCase()}` : null,
+      ].filter((k): k is string => Boolean(k));
+
+      for (const key of cacheKeys) {
+        const cachedId = readArrIdCache(this.sonarrSeriesIdCache, key);
+        if (!cachedId) continue;
+        const cached = await this.sonarr.getSeriesById({
+          baseUrl: sonarrBaseUrl,
+          apiKey: sonarrApiKey,
+          seriesId: cachedId,
+        });
+        // A title key can point at a different series with the same name; when the
+        // caller knows the TVDB id, only accept a cached series that carries it.
+        if (
+          cached &&
+          (!params.tvdbId || toInt(cached.tvdbId) === params.tvdbId)
+        ) {
+          return cached;
+        }
+        this.sonarrSeriesIdCache.delete(key);
+      }
+
+      const remember = (series: SonarrSeries) => {
+        for (const key of cacheKeys) {
+          writeArrIdCache(this.sonarrSeriesIdCache, key, series.id);
+        }
+        return series;
+      };
+
       const all = await this.sonarr.listSeries({
         baseUrl: sonarrBaseUrl,
         apiKey: sonarrApiKey,
@@ -2333,28 +2470,27 @@ export class CleanupAfterAddingNewContentJob {
 
       if (params.tvdbId) {
         const byTvdb = all.find((s) => toInt(s.tvdbId) === params.tvdbId);
-        if (byTvdb) return byTvdb;
+        if (byTvdb) return remember(byTvdb);
       }
 
-      const q = params.title.trim();
       if (!q) return null;
 
-      const exact = all.find(
-        (s) =>
-          typeof s.title === 'string' &&
-          s.title.toLowerCase() === q.toLowerCase(),
-      );
-      if (exact) return exact;
+      const index = getTitleIndex(all);
+      const exact =
+        index.byLower.get(q.toLowerCase()) ?? index.byNorm.get(normTitle(q));
+      if (exact) return remember(exact);
 
       // Fuzzy fallback (similar spirit to Python difflib cutoff ~0.7)
+      const scoreTitle = diceScorer(q);
       let best: { s: SonarrSeries; score: number } | null = null;
       for (const s of all) {
         const t = typeof s.title === 'string' ? s.title : '';
         if (!t) continue;
-        const score = diceCoefficient(q, t);
+        const score = scoreTitle(t, best?.score);
         if (!best || score > best.score) best = { s, score };
+        if (best.score === 1) break;
       }
-      if (best && best.score >= 0.7) return best.s;
+      if (best && best.score >= 0.7) return remember(best.s);
       return null;
     };
 
@@ -2931,32 +3067,50 @@ export class CleanupAfterAddingNewContentJob {
       let movieRatingKey = ratingKey;
       let movieSectionKeyHint: string | null = null;
       let movieSectionTitleHint: string | null = null;
+      let movieSearchHit: Awaited<
+        ReturnType<PlexServerService['findMovieRatingKeyByTitle']>
+      > = null;
       if (!movieRatingKey && title) {
-        for (const sec of plexMovieSections) {
-          const found = await this.plexServer
-            .findMovieRatingKeyByTitle({
-              baseUrl: plexBaseUrl,
-              token: plexToken,
-              librarySectionKey: sec.key,
-              title,
-            })
-            .catch(() => null);
-          if (found?.ratingKey) {
-            movieRatingKey = found.ratingKey;
-            movieSectionKeyHint = sec.key;
-            movieSectionTitleHint = sec.title;
-            break;
-          }
+        // Search every movie library at once; the first section (in library order)
+        // with a hit still wins, as with the previous sequential scan.
+        const found = await Promise.all(
+          plexMovieSections.map((sec) =>
+            this.plexServer
+              .findMovieRatingKeyByTitle({
+                baseUrl: plexBaseUrl,
+                token: plexToken,
+                librarySectionKey: sec.key,
+                title,
+              })
+              .catch(() => null),
+          ),
+        );
+        const hit = found.findIndex((f) => Boolean(f?.ratingKey));
+        if (hit >= 0) {
+          movieSearchHit = found[hit];
+          movieRatingKey = movieSearchHit?.ratingKey ?? null;
+          movieSectionKeyHint = plexMovieSections[hit].key;
+          movieSectionTitleHint = plexMovieSections[hit].title;
         }
       }
 
-      let tmdbId: number | null = tmdbIdInput ?? null;
-      let resolvedTitle = title;
-      let resolvedYear = year;
+      // Only trust the search hit's own fields when it is an exact title match; a
+      // looser hit may be a different movie, so its details come from metadata.
+      const trustedHit =
+        movieSearchHit && normTitle(movieSearchHit.title) === normTitle(title)
+          ? movieSearchHit
+          : null;
+      let tmdbId: number | null =
+        tmdbIdInput ?? trustedHit?.tmdbIds[0] ?? null;
+      let resolvedTitle = trustedHit?.title || title;
+      let resolvedYear = trustedHit?.year ?? year ?? null;
       let movieLibrarySectionKey: string | null = movieSectionKeyHint;
       let movieLibrarySectionTitle: string | null = movieSectionTitleHint;
 
-      if (movieRatingKey) {
+      // An exact title-search hit already carries the title, year, section and GUIDs;
+      // only go back to Plex for full metadata when that left the TMDB id unresolved.
+      const needsMetadata = !trustedHit || !tmdbId;
+      if (movieRatingKey && needsMetadata) {
         try {
           const meta = await this.plexServer.getMetadataDetails({
             baseUrl: plexBaseUrl,
@@ -3031,26 +3185,52 @@ export class CleanupAfterAddingNewContentJob {
           await ctx.info('radarr: attempting unmonitor for movie', {
             title: movieTitle,
           });
-          const movies = await this.radarr.listMovies({
-            baseUrl: radarrBaseUrl,
-            apiKey: radarrApiKey,
-          });
-          radarrSummary.connected = true;
-
           const tmdbIdForRadarr = tmdbId;
 
-          const normalizedWanted = normTitle(movieTitle);
-          const findByTitle = (m: RadarrMovie) => {
-            const t = typeof m.title === 'string' ? m.title : '';
-            return t && normTitle(t) === normalizedWanted;
-          };
-
-          const candidate =
-            (tmdbIdForRadarr
-              ? movies.find((m) => toInt(m.tmdbId) === tmdbIdForRadarr)
-              : null) ??
-            movies.find(findByTitle) ??
-            null;
+          // Resolve by TMDB id first (server-side filter); the full movie list is only a
+          // fallback for title matching when the id is unknown or not in Radarr.
+          let candidate: RadarrMovie | null = tmdbIdForRadarr
+            ? await this.radarr.getMovieByTmdbId({
+                baseUrl: radarrBaseUrl,
+                apiKey: radarrApiKey,
+                tmdbId: tmdbIdForRadarr,
+              })
+            : null;
+          const titleCacheKey = `${radarrBaseUrl}|${normTitle(movieTitle)}`;
+          if (!candidate) {
+            const cachedId = readArrIdCache(
+              this.radarrMovieIdCache,
+              titleCacheKey,
+            );
+            if (cachedId) {
+              candidate = await this.radarr.getMovieById({
+                baseUrl: radarrBaseUrl,
+                apiKey: radarrApiKey,
+                movieId: cachedId,
+              });
+            }
+          }
+          if (!candidate) {
+            const movies = await this.radarr.listMovies({
+              baseUrl: radarrBaseUrl,
+              apiKey: radarrApiKey,
+            });
+            // The list is shared via RadarrService's short-lived cache, so the title
+            // index built here is reused by runs that land within the same window.
+            const index = getTitleIndex(movies);
+            candidate =
+              index.byLower.get(movieTitle.toLowerCase()) ??
+              index.byNorm.get(normTitle(movieTitle)) ??
+              null;
+            if (candidate) {
+              writeArrIdCache(
+                this.radarrMovieIdCache,
+                titleCacheKey,
+                candidate.id,
+              );
+            }
+          }
+          radarrSummary.connected = true;
 
           if (!candidate) {
             radarrSummary.movieFound = false;
@@ -3394,54 +3574,43 @@ export class CleanupAfterAddingNewContentJob {
       let failures = 0;
 
       if (features.unmonitorInArr) {
-        // Unmonitor episodes that are present in Plex.
-        for (const r of toUnmonitor) {
-          if (ctx.dryRun) {
-            episodesUnmonitored += 1;
-            continue;
+        if (ctx.dryRun) {
+          episodesUnmonitored = toUnmonitor.length;
+          episodesMonitored = toMonitor.length;
+        } else {
+          // Unmonitor episodes that are present in Plex.
+          const unmonitorRes = await setSonarrEpisodesMonitored({
+            sonarr: this.sonarr,
+            ctx,
+            baseUrl: sonarrBaseUrl,
+            apiKey: sonarrApiKey,
+            rows: toUnmonitor,
+            monitored: false,
+          });
+          episodesUnmonitored = unmonitorRes.updated;
+          failures += unmonitorRes.failed.length;
+          for (const f of unmonitorRes.failed) {
+            (summary.warnings as string[]).push(
+              `sonarr episode: failed to unmonitor ${f.key} (continuing): ${f.error}`,
+            );
           }
-          const ok = await this.sonarr
-            .setEpisodeMonitored({
-              baseUrl: sonarrBaseUrl,
-              apiKey: sonarrApiKey,
-              episode: r.ep,
-              monitored: false,
-            })
-            .then(() => true)
-            .catch((err) => {
-              failures += 1;
-              const msg = (err as Error)?.message ?? String(err);
-              (summary.warnings as string[]).push(
-                `sonarr episode: failed to unmonitor ${r.key} (continuing): ${msg}`,
-              );
-              return false;
-            });
-          if (ok) episodesUnmonitored += 1;
-        }
 
-        // Monitor episodes that are missing from Plex.
-        for (const r of toMonitor) {
-          if (ctx.dryRun) {
-            episodesMonitored += 1;
-            continue;
+          // Monitor episodes that are missing from Plex.
+          const monitorRes = await setSonarrEpisodesMonitored({
+            sonarr: this.sonarr,
+            ctx,
+            baseUrl: sonarrBaseUrl,
+            apiKey: sonarrApiKey,
+            rows: toMonitor,
+            monitored: true,
+          });
+          episodesMonitored = monitorRes.updated;
+          failures += monitorRes.failed.length;
+          for (const f of monitorRes.failed) {
+            (summary.warnings as string[]).push(
+              `sonarr episode: failed to monitor ${f.key} (continuing): ${f.error}`,
+            );
           }
-          const ok = await this.sonarr
-            .setEpisodeMonitored({
-              baseUrl: sonarrBaseUrl,
-              apiKey: sonarrApiKey,
-              episode: r.ep,
-              monitored: true,
-            })
-            .then(() => true)
-            .catch((err) => {
-              failures += 1;
-              const msg = (err as Error)?.message ?? String(err);
-              (summary.warnings as string[]).push(
-                `sonarr episode: failed to monitor ${r.key} (continuing): ${msg}`,
-              );
-              return false;
-            });
-          if (ok) episodesMonitored += 1;
         }
       } else {
         await ctx.info(
@@ -3698,52 +3867,41 @@ export class CleanupAfterAddingNewContentJob {
         let failures = 0;
 
         if (features.unmonitorInArr) {
-          for (const r of toUnmonitor) {
-            if (ctx.dryRun) {
-              episodesUnmonitored += 1;
-              continue;
+          if (ctx.dryRun) {
+            episodesUnmonitored = toUnmonitor.length;
+            episodesMonitored = toMonitor.length;
+          } else {
+            const unmonitorRes = await setSonarrEpisodesMonitored({
+              sonarr: this.sonarr,
+              ctx,
+              baseUrl: sonarrBaseUrl,
+              apiKey: sonarrApiKey,
+              rows: toUnmonitor,
+              monitored: false,
+            });
+            episodesUnmonitored = unmonitorRes.updated;
+            failures += unmonitorRes.failed.length;
+            for (const f of unmonitorRes.failed) {
+              (summary.warnings as string[]).push(
+                `sonarr episode: failed to unmonitor ${f.key} (continuing): ${f.error}`,
+              );
             }
-            const ok = await this.sonarr
-              .setEpisodeMonitored({
-                baseUrl: sonarrBaseUrl,
-                apiKey: sonarrApiKey,
-                episode: r.ep,
-                monitored: false,
-              })
-              .then(() => true)
-              .catch((err) => {
-                failures += 1;
-                const msg = (err as Error)?.message ?? String(err);
-                (summary.warnings as string[]).push(
-                  `sonarr episode: failed to unmonitor ${r.key} (continuing): ${msg}`,
-                );
-                return false;
-              });
-            if (ok) episodesUnmonitored += 1;
-          }
 
-          for (const r of toMonitor) {
-            if (ctx.dryRun) {
-              episodesMonitored += 1;
-              continue;
+            const monitorRes = await setSonarrEpisodesMonitored({
+              sonarr: this.sonarr,
+              ctx,
+              baseUrl: sonarrBaseUrl,
+              apiKey: sonarrApiKey,
+              rows: toMonitor,
+              monitored: true,
+            });
+            episodesMonitored = monitorRes.updated;
+            failures += monitorRes.failed.length;
+            for (const f of monitorRes.failed) {
+              (summary.warnings as string[]).push(
+                `sonarr episode: failed to monitor ${f.key} (continuing): ${f.error}`,
+              );
             }
-            const ok = await this.sonarr
-              .setEpisodeMonitored({
-                baseUrl: sonarrBaseUrl,
-                apiKey: sonarrApiKey,
-                episode: r.ep,
-                monitored: true,
-              })
-              .then(() => true)
-              .catch((err) => {
-                failures += 1;
-                const msg = (err as Error)?.message ?? String(err);
-                (summary.warnings as string[]).push(
-                  `sonarr episode: failed to monitor ${r.key} (continuing): ${msg}`,
-                );
-                return false;
-              });
-            if (ok) episodesMonitored += 1;
           }
         } else {
           await ctx.info(
@@ -3947,6 +4105,7 @@ export class CleanupAfterAddingNewContentJob {
               baseUrl: sonarrBaseUrl,
               apiKey: sonarrApiKey,
               seriesId: series.id,
+              seasonNumber: seasonNum,
             });
             const episode = episodes.find(
               (ep) =>
@@ -4030,6 +4189,73 @@ export class CleanupAfterAddingNewContentJob {
   }
 }
 
+/**
+ * Sets the monitored flag on a set of Sonarr episodes with one bulk call. Falls back
+ * to per-episode updates only when Sonarr rejects the bulk endpoint (4xx, e.g. 404/405
+ * on older versions); a timeout or server error would just fail again N times, so
+ * every row is reported as failed instead.
+ */
+export async function setSonarrEpisodesMonitored(params: {
+  sonarr: Pick<SonarrService, 'setEpisodesMonitored' | 'setEpisodeMonitored'>;
+  ctx: JobContext;
+  baseUrl: string;
+  apiKey: string;
+  rows: Array<{ ep: SonarrEpisode; key: string }>;
+  monitored: boolean;
+}): Promise<{
+  updated: number;
+  failed: Array<{ key: string; error: string }>;
+}> {
+  const { sonarr, ctx, baseUrl, apiKey, rows, monitored } = params;
+  if (!rows.length) return { updated: 0, failed: [] };
+
+  try {
+    await sonarr.setEpisodesMonitored({
+      baseUrl,
+      apiKey,
+      episodeIds: rows.map((r) => r.ep.id),
+      monitored,
+    });
+    return { updated: rows.length, failed: [] };
+  } catch (err) {
+    const error = (err as Error)?.message ?? String(err);
+    const rejected =
+      err instanceof SonarrHttpError && err.status >= 400 && err.status < 500;
+    await ctx.warn('sonarr: bulk episode monitor update failed', {
+      monitored,
+      episodes: rows.length,
+      error,
+      fallback: rejected ? 'per_episode' : 'none',
+    });
+    if (!rejected) {
+      return {
+        updated: 0,
+        failed: rows.map((r) => ({ key: r.key, error })),
+      };
+    }
+  }
+
+  let updated = 0;
+  const failed: Array<{ key: string; error: string }> = [];
+  for (const r of rows) {
+    try {
+      await sonarr.setEpisodeMonitored({
+        baseUrl,
+        apiKey,
+        episode: r.ep,
+        monitored,
+      });
+      updated += 1;
+    } catch (err) {
+      failed.push({
+        key: r.key,
+        error: (err as Error)?.message ?? String(err),
+      });
+    }
+  }
+  return { updated, failed };
+}
+
 export function buildMediaAddedCleanupReport(params: {
   ctx: JobContext;
   raw: JsonObject;
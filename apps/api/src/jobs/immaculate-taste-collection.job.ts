@@ -12,7 +12,10 @@ import { ImmaculateTasteCollectionService } from '../immaculate-taste-collection
 import { ImmaculateTasteShowCollectionService } from '../immaculate-taste-collection/immaculate-taste-show-collection.service';
 import { normalizeTitleForMatching } from '../lib/title-normalize';
 import { resolvePlexLibrarySelection } from '../plex/plex-library-selection.utils';
-import { isPlexUserExcludedFromMonitoring } from '../plex/plex-user-selection.utils';
+import {
+  isPlexAdminUser,
+  isPlexUserExcludedFromMonitoring,
+} from '../plex/plex-user-selection.utils';
 import type {
   JobContext,
   JobRunResult,
@@ -1602,23 +1605,26 @@ export class ImmaculateTasteCollectionJob {
         .catch(() => undefined);
       for (const selection of movieCollectionSelections) {
         try {
-          const refresherResult = await this.immaculateTasteRefresher.run({
-            ...ctx,
-            input: {
-              ...(ctx.input ?? {}),
-              plexUserId,
-              plexUserTitle,
-              pinCollections: true,
-              pinTarget,
-              includeMovies: true,
-              includeTv: false,
-              movieSectionKey,
-              movieLibraryName,
-              profileId: selection.collectionProfile.profileId,
-              movieCollectionBaseName:
-                selection.profile.movieCollectionBaseName ?? null,
+          const refresherResult = await this.immaculateTasteRefresher.run(
+            {
+              ...ctx,
+              input: {
+                ...(ctx.input ?? {}),
+                plexUserId,
+                plexUserTitle,
+                pinCollections: true,
+                pinTarget,
+                includeMovies: true,
+                includeTv: false,
+                movieSectionKey,
+                movieLibraryName,
+                profileId: selection.collectionProfile.profileId,
+                movieCollectionBaseName:
+                  selection.profile.movieCollectionBaseName ?? null,
+              },
             },
-          });
+            { settings, secrets },
+          );
           const profileRefresherSummary =
             (refresherResult.summary as JsonObject | null) ?? null;
           refresherByProfile.push({
@@ -1667,22 +1673,25 @@ export class ImmaculateTasteCollectionJob {
       );
       if (!defaultAlreadyRefreshed) {
         try {
-          await this.immaculateTasteRefresher.run({
-            ...ctx,
-            input: {
-              ...(ctx.input ?? {}),
-              plexUserId,
-              plexUserTitle,
-              pinCollections: true,
-              pinTarget,
-              includeMovies: true,
-              includeTv: false,
-              movieSectionKey,
-              movieLibraryName,
-              profileId: 'default',
-              movieCollectionBaseName: null,
+          await this.immaculateTasteRefresher.run(
+            {
+              ...ctx,
+              input: {
+                ...(ctx.input ?? {}),
+                plexUserId,
+                plexUserTitle,
+                pinCollections: true,
+                pinTarget,
+                includeMovies: true,
+                includeTv: false,
+                movieSectionKey,
+                movieLibraryName,
+                profileId: 'default',
+                movieCollectionBaseName: null,
+              },
             },
-          });
+            { settings, secrets },
+          );
           await ctx.info(
             'immaculateTastePoints: default collection refresher done (chained)',
           );
@@ -3001,23 +3010,26 @@ export class ImmaculateTasteCollectionJob {
         .catch(() => undefined);
       for (const selection of showCollectionSelections) {
         try {
-          const refresherResult = await this.immaculateTasteRefresher.run({
-            ...ctx,
-            input: {
-              ...(ctx.input ?? {}),
-              plexUserId,
-              plexUserTitle,
-              pinCollections: true,
-              pinTarget,
-              includeMovies: false,
-              includeTv: true,
-              tvSectionKey,
-              tvLibraryName,
-              profileId: selection.collectionProfile.profileId,
-              tvCollectionBaseName:
-                selection.profile.showCollectionBaseName ?? null,
+          const refresherResult = await this.immaculateTasteRefresher.run(
+            {
+              ...ctx,
+              input: {
+                ...(ctx.input ?? {}),
+                plexUserId,
+                plexUserTitle,
+                pinCollections: true,
+                pinTarget,
+                includeMovies: false,
+                includeTv: true,
+                tvSectionKey,
+                tvLibraryName,
+                profileId: selection.collectionProfile.profileId,
+                tvCollectionBaseName:
+                  selection.profile.showCollectionBaseName ?? null,
+              },
             },
-          });
+            { settings, secrets },
+          );
           const profileRefresherSummary =
             (refresherResult.summary as JsonObject | null) ?? null;
           refresherByProfile.push({
@@ -3069,22 +3081,25 @@ export class ImmaculateTasteCollectionJob {
       );
       if (!defaultAlreadyRefreshed) {
         try {
-          await this.immaculateTasteRefresher.run({
-            ...ctx,
-            input: {
-              ...(ctx.input ?? {}),
-              plexUserId,
-              plexUserTitle,
-              pinCollections: true,
-              pinTarget,
-              includeMovies: false,
-              includeTv: true,
-              tvSectionKey,
-              tvLibraryName,
-              profileId: 'default',
-              tvCollectionBaseName: null,
+          await this.immaculateTasteRefresher.run(
+            {
+              ...ctx,
+              input: {
+                ...(ctx.input ?? {}),
+                plexUserId,
+                plexUserTitle,
+                pinCollections: true,
+                pinTarget,
+                includeMovies: false,
+                includeTv: true,
+                tvSectionKey,
+                tvLibraryName,
+                profileId: 'default',
+                tvCollectionBaseName: null,
+              },
             },
-          });
+            { settings, secrets },
+          );
           await ctx.info(
             'immaculateTastePoints(tv): default collection refresher done (chained)',
           );
@@ -3239,34 +3254,11 @@ export class ImmaculateTasteCollectionJob {
     const fromInput = plexUserIdRaw
       ? await this.plexUsers.getPlexUserById(plexUserIdRaw)
       : null;
-    const normalize = (value: string | null | undefined) =>
-      String(value ?? '')
-        .trim()
-        .toLowerCase();
-    const isAdminUser = (row: {
-      id: string;
-      plexAccountId: number | null;
-      plexAccountTitle: string;
-      isAdmin?: boolean;
-    }) => {
-      if (row.id === admin.id) return true;
-      if (
-        row.plexAccountId !== null &&
-        admin.plexAccountId !== null &&
-        row.plexAccountId === admin.plexAccountId
-      ) {
-        return true;
-      }
-      const rowTitle = normalize(row.plexAccountTitle);
-      const adminTitle = normalize(admin.plexAccountTitle);
-      if (rowTitle && adminTitle && rowTitle === adminTitle) return true;
-      return row.isAdmin === true;
-    };
     if (fromInput) {
       return {
         plexUserId: fromInput.id,
         plexUserTitle: fromInput.plexAccountTitle,
-        pinCollections: isAdminUser(fromInput),
+        pinCollections: isPlexAdminUser(fromInput, admin),
       };
     }
 
@@ -3278,7 +3270,7 @@ export class ImmaculateTasteCollectionJob {
         return {
           plexUserId: byTitle.id,
           plexUserTitle: byTitle.plexAccountTitle,
-          pinCollections: isAdminUser(byTitle),
+          pinCollections: isPlexAdminUser(byTitle, admin),
         };
       }
     }
@@ -3292,7 +3284,7 @@ export class ImmaculateTasteCollectionJob {
         return {
           plexUserId: byAccount.id,
           plexUserTitle: byAccount.plexAccountTitle,
-          pinCollections: isAdminUser(byAccount),
+          pinCollections: isPlexAdminUser(byAccount, admin),
         };
       }
     }
@@ -39,6 +39,7 @@ import {
   sortSweepUsers,
 } from './refresher-sweep.utils';
 import {
+  isPlexAdminUser,
   isPlexUserExcludedFromMonitoring,
   resolvePlexUserMonitoringSelection,
 } from '../plex/plex-user-selection.utils';
@@ -218,7 +219,15 @@ export class ImmaculateTasteRefresherJob {
     private readonly immaculateTasteProfiles: ImmaculateTasteProfileService,
   ) {}
 
-  async run(ctx: JobContext): Promise<JobRunResult> {
+  // Chained runs pass in the settings the parent job already loaded, so the
+  // per-profile refreshes do not re-read (and re-decrypt) them every time.
+  async run(
+    ctx: JobContext,
+    preloaded?: {
+      settings: Record<string, unknown>;
+      secrets: Record<string, unknown>;
+    },
+  ): Promise<JobRunResult> {
     const input = ctx.input ?? {};
     const mode: 'targeted' | 'sweep' = hasExplicitRefresherScopeInput(input)
       ? 'targeted'
@@ -271,7 +280,7 @@ export class ImmaculateTasteRefresherJob {
           : '';
 
     const { settings, secrets } =
-      await this.settingsService.getInternalSettings(ctx.userId);
+      preloaded ?? (await this.settingsService.getInternalSettings(ctx.userId));
     if (isPlexUserExcludedFromMonitoring({ settings, plexUserId })) {
       const summary: JsonObject = {
         mode,
@@ -1759,29 +1768,6 @@ export class ImmaculateTasteRefresherJob {
     const admin = await this.plexUsers.ensureAdminPlexUser({
       userId: ctx.userId,
     });
-    const normalize = (value: string | null | undefined) =>
-      String(value ?? '')
-        .trim()
-        .toLowerCase();
-    const isAdminUser = (user: {
-      id: string;
-      plexAccountId: number | null;
-      plexAccountTitle: string;
-      isAdmin: boolean;
-    }) => {
-      if (user.id === admin.id) return true;
-      if (
-        user.plexAccountId !== null &&
-        admin.plexAccountId !== null &&
-        user.plexAccountId === admin.plexAccountId
-      ) {
-        return true;
-      }
-      const userTitle = normalize(user.plexAccountTitle);
-      const adminTitle = normalize(admin.plexAccountTitle);
-      if (userTitle && adminTitle && userTitle === adminTitle) return true;
-      return user.isAdmin;
-    };
 
     await ctx.info('immaculateTasteRefresher: sweep start', {
       mode: 'sweep',
@@ -1797,7 +1783,7 @@ export class ImmaculateTasteRefresherJob {
       usersSelected: orderedUsers.map((u) => ({
         plexUserId: u.id,
         plexUserTitle: u.plexAccountTitle,
-        isAdmin: isAdminUser(u),
+        isAdmin: isPlexAdminUser(u, admin),
       })),
       usersSkippedByMonitoring: usersExcludedByMonitoring.map((u) => ({
         plexUserId: u.id,
@@ -1810,7 +1796,7 @@ export class ImmaculateTasteRefresherJob {
     let usersFailed = 0;
 
     for (const user of orderedUsers) {
-      const userIsAdmin = isAdminUser(user);
+      const userIsAdmin = isPlexAdminUser(user, admin);
       const pinTarget: 'admin' | 'friends' = userIsAdmin ? 'admin' : 'friends';
       const profileResults: JsonObject[] = [];
       let userFailed = false;
@@ -1939,34 +1925,11 @@ export class ImmaculateTasteRefresherJob {
     const fromInput = plexUserIdRaw
       ? await this.plexUsers.getPlexUserById(plexUserIdRaw)
       : null;
-    const normalize = (value: string | null | undefined) =>
-      String(value ?? '')
-        .trim()
-        .toLowerCase();
-    const isAdminUser = (row: {
-      id: string;
-      plexAccountId: number | null;
-      plexAccountTitle: string;
-      isAdmin?: boolean;
-    }) => {
-      if (row.id === admin.id) return true;
-      if (
-        row.plexAccountId !== null &&
-        admin.plexAccountId !== null &&
-        row.plexAccountId === admin.plexAccountId
-      ) {
-        return true;
-      }
-      const rowTitle = normalize(row.plexAccountTitle);
-      const adminTitle = normalize(admin.plexAccountTitle);
-      if (rowTitle && adminTitle && rowTitle === adminTitle) return true;
-      return row.isAdmin === true;
-    };
     if (fromInput) {
       return {
         plexUserId: fromInput.id,
         plexUserTitle: fromInput.plexAccountTitle,
-        pinCollections: isAdminUser(fromInput),
+        pinCollections: isPlexAdminUser(fromInput, admin),
       };
     }
 
@@ -1978,7 +1941,7 @@ export class ImmaculateTasteRefresherJob {
         return {
           plexUserId: byTitle.id,
           plexUserTitle: byTitle.plexAccountTitle,
-          pinCollections: isAdminUser(byTitle),
+          pinCollections: isPlexAdminUser(byTitle, admin),
         };
       }
     }
@@ -1992,7 +1955,7 @@ export class ImmaculateTasteRefresherJob {
         return {
           plexUserId: byAccount.id,
           plexUserTitle: byAccount.plexAccountTitle,
-          pinCollections: isAdminUser(byAccount),
+          pinCollections: isPlexAdminUser(byAccount, admin),
         };
       }
     }
@@ -256,7 +256,9 @@ export function dedupeScrapedMovies(movies: ScrapedMovie[]): ScrapedMovie[] {
   return out;
 }
 
-export function buildRadarrMovieIndex(movies: RadarrMovie[]): RadarrMovieIndex {
+export function buildRadarrMovieIndex(
+  movies: readonly RadarrMovie[],
+): RadarrMovieIndex {
   const titleYearKeys = new Set<string>();
   const tmdbIds = new Set<number>();
 
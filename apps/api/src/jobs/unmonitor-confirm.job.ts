@@ -400,6 +400,16 @@ export class UnmonitorConfirmJob {
       movieLibraries: movieSections.map((section) => section.title),
     });
 
+    // The Radarr movie list doesn't depend on the Plex scan below, so load it
+    // while the (per-library, often slow) TMDB index is being built. The
+    // rejection is observed here and surfaced by the await after the scan.
+    const allMoviesPromise = this.radarr.listMovies({
+      baseUrl: radarrBaseUrl,
+      apiKey: radarrApiKey,
+      fresh: true,
+    });
+    allMoviesPromise.catch(() => undefined);
+
     const plexTmdbIds = new Set<number>();
     setProgress({
       step: 'plex_tmdb_index',
@@ -445,10 +455,7 @@ export class UnmonitorConfirmJob {
       message: 'Loading Radarr movies…',
     });
 
-    const allMovies = await this.radarr.listMovies({
-      baseUrl: radarrBaseUrl,
-      apiKey: radarrApiKey,
-    });
+    const allMovies = await allMoviesPromise;
     const unmonitoredMovies = allMovies.filter((movie) => !movie?.monitored);
 
     let checked = 0;
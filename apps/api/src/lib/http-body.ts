@@ -0,0 +1,7 @@
+/**
+ * Read and drop a response body the caller does not need. fetch only returns a
+ * keep-alive socket to its pool once the body has been consumed.
+ */
+export async function discardBody(res: Response): Promise<void> {
+  await res.arrayBuffer().catch(() => undefined);
+}
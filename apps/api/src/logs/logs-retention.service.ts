@@ -19,9 +19,11 @@ export class LogsRetentionService implements OnModuleInit {
   }
 
   private cleanupOnce() {
-    const cutoff = new Date(
-      Date.now() - LogsRetentionService.RETENTION_DAYS * 24 * 60 * 60_000,
-    );
+    const retentionMs = LogsRetentionService.RETENTION_DAYS * 24 * 60 * 60_000;
+    // The buffer is in-memory, so nothing in it can be older than the process.
+    if (process.uptime() * 1000 < retentionMs) return;
+
+    const cutoff = new Date(Date.now() - retentionMs);
     const res = pruneServerLogsOlderThan(cutoff);
     if (res.removed > 0) {
       this.logger.log(
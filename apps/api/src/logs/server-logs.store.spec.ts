@@ -0,0 +1,50 @@
+import {
+  addServerLog,
+  clearServerLogs,
+  listServerLogs,
+  pruneServerLogsOlderThan,
+} from './server-logs.store';
+
+describe('server-logs.store', () => {
+  beforeEach(() => {
+    jest.useFakeTimers();
+    clearServerLogs();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('prunes entries older than the cutoff and keeps order', () => {
+    jest.setSystemTime(new Date('2024-01-01T00:00:00Z'));
+    addServerLog({ level: 'info', message: 'old' });
+    jest.setSystemTime(new Date('2024-01-10T00:00:00Z'));
+    addServerLog({ level: 'info', message: 'new-1' });
+    addServerLog({ level: 'warn', message: 'new-2' });
+
+    const res = pruneServerLogsOlderThan(new Date('2024-01-05T00:00:00Z'));
+
+    expect(res).toEqual({ removed: 1, kept: 2 });
+    expect(listServerLogs().logs.map((l) => l.message)).toEqual([
+      'new-1',
+      'new-2',
+    ]);
+
+    addServerLog({ level: 'info', message: 'new-3' });
+    expect(listServerLogs().logs.map((l) => l.message)).toEqual([
+      'new-1',
+      'new-2',
+      'new-3',
+    ]);
+  });
+
+  it('leaves the buffer untouched when nothing is expired', () => {
+    jest.setSystemTime(new Date('2024-01-10T00:00:00Z'));
+    addServerLog({ level: 'info', message: 'fresh' });
+
+    const res = pruneServerLogsOlderThan(new Date('2024-01-05T00:00:00Z'));
+
+    expect(res).toEqual({ removed: 0, kept: 1 });
+    expect(listServerLogs().logs).toHaveLength(1);
+  });
+});
@@ -45,26 +45,32 @@ export function pruneServerLogsOlderThan(cutoff: Date): {
   kept: number;
 } {
   if (!count) return { removed: 0, kept: 0 };
-  const cutoffMs = cutoff.getTime();
-  if (!Number.isFinite(cutoffMs)) return { removed: 0, kept: count };
+  if (!Number.isFinite(cutoff.getTime())) return { removed: 0, kept: count };
+  // Entry times are toISOString() output, which sorts lexically in time order,
+  // so compare the strings directly instead of parsing each one.
+  const cutoffIso = cutoff.toISOString();
 
-  const { logs } = listServerLogs({ limit: MAX_ENTRIES });
-  const kept = logs.filter((l) => {
-    const ms = Date.parse(l.time);
-    return Number.isFinite(ms) ? ms >= cutoffMs : true;
-  });
+  // Entries are appended in time order, so expired ones form a prefix of the
+  // ring: stop at the first entry that is still fresh.
+  const oldestIndex = count === MAX_ENTRIES ? writeIndex : 0;
+  let removed = 0;
+  while (removed < count) {
+    const entry = ring[(oldestIndex + removed) % MAX_ENTRIES];
+    if (entry && entry.time >= cutoffIso) break;
+    removed += 1;
+  }
+  if (!removed) return { removed: 0, kept: count };
 
-  // Rebuild ring from kept logs.
-  for (let i = 0; i < ring.length; i += 1) ring[i] = null;
-  writeIndex = 0;
-  count = 0;
-  for (const entry of kept.slice(-MAX_ENTRIES)) {
-    ring[writeIndex] = entry;
-    writeIndex = (writeIndex + 1) % MAX_ENTRIES;
-    count = Math.min(MAX_ENTRIES, count + 1);
+  const kept: ServerLogEntry[] = [];
+  for (let i = removed; i < count; i += 1) {
+    const entry = ring[(oldestIndex + i) % MAX_ENTRIES];
+    if (entry) kept.push(entry);
   }
+  for (let i = 0; i < ring.length; i += 1) ring[i] = kept[i] ?? null;
+  count = kept.length;
+  writeIndex = count % MAX_ENTRIES;
 
-  return { removed: Math.max(0, logs.length - kept.length), kept: kept.length };
+  return { removed, kept: count };
 }
 
 function normalizeMessage(input: unknown): string {
@@ -98,15 +104,12 @@ export function addServerLog(params: {
   stack?: unknown;
   context?: unknown;
 }) {
-  const msg = normalizeMessage(params.message).trim();
-  const stack = normalizeMessage(params.stack).trim();
-  const combined = stack ? (msg ? `${msg}\n${stack}` : stack) : msg;
-  if (!combined) return;
-
   const contextRaw =
     typeof params.context === 'string' ? params.context.trim() : '';
   const context = contextRaw ? contextRaw : null;
 
+  // Check the context filter before formatting, so dropped lines never pay for
+  // message/stack normalization.
   if (
     params.level !== 'error' &&
     context &&
@@ -117,6 +120,11 @@ export function addServerLog(params: {
     return;
   }
 
+  const msg = normalizeMessage(params.message).trim();
+  const stack = normalizeMessage(params.stack).trim();
+  const combined = stack ? (msg ? `${msg}\n${stack}` : stack) : msg;
+  if (!combined) return;
+
   ring[writeIndex] = {
     id: nextId++,
     time: new Date().toISOString(),
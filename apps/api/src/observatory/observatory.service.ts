@@ -1413,6 +1413,7 @@ export class ObservatoryService {
         const movies = await this.radarr.listMovies({
           baseUrl: radarrBaseUrl,
           apiKey: radarrApiKey,
+          fresh: true,
         });
         const byTmdb = new Map<number, RadarrMovie>();
         for (const m of movies) {
@@ -1422,20 +1423,19 @@ export class ObservatoryService {
           }
         }
 
+        const toUnmonitor: RadarrMovie[] = [];
         for (const r of rejected) {
           if (!r.sentToRadarrAt) continue;
           const movie = byTmdb.get(r.tmdbId) ?? null;
           if (!movie) continue;
-          await this.radarr
-            .setMovieMonitored({
-              baseUrl: radarrBaseUrl,
-              apiKey: radarrApiKey,
-              movie,
-              monitored: false,
-            })
-            .catch(() => undefined);
-          unmonitored += 1;
+          toUnmonitor.push(movie);
         }
+        await this.unmonitorRadarrMovies({
+          baseUrl: radarrBaseUrl,
+          apiKey: radarrApiKey,
+          movies: toUnmonitor,
+        });
+        unmonitored += toUnmonitor.length;
       }
 
       // Add approved movies to Radarr (only when approvalRequired is enabled).
@@ -1856,6 +1856,7 @@ export class ObservatoryService {
       const movies = await this.radarr.listMovies({
         baseUrl: radarrBaseUrl,
         apiKey: radarrApiKey,
+        fresh: true,
       });
       const byTmdb = new Map<number, RadarrMovie>();
       for (const m of movies) {
@@ -1865,20 +1866,19 @@ export class ObservatoryService {
         }
       }
 
+      const toUnmonitor: RadarrMovie[] = [];
       for (const r of rejected) {
         if (!r.sentToRadarrAt) continue;
         const movie = byTmdb.get(r.tmdbId) ?? null;
         if (!movie) continue;
-        await this.radarr
-          .setMovieMonitored({
-            baseUrl: radarrBaseUrl,
-            apiKey: radarrApiKey,
-            movie,
-            monitored: false,
-          })
-          .catch(() => undefined);
-        unmonitored += 1;
+        toUnmonitor.push(movie);
       }
+      await this.unmonitorRadarrMovies({
+        baseUrl: radarrBaseUrl,
+        apiKey: radarrApiKey,
+        movies: toUnmonitor,
+      });
+      unmonitored += toUnmonitor.length;
     }
 
     // --- ARR add for approved items (only when approvalRequired is enabled) ---
@@ -2262,6 +2262,27 @@ export class ObservatoryService {
     };
   }
 
+  /**
+   * Unmonitors rejected movies with a single Radarr editor call, falling back to
+   * per-movie updates if the bulk endpoint is unavailable. Best-effort, like the
+   * per-movie loop it replaces.
+   */
+  private async unmonitorRadarrMovies(params: {
+    baseUrl: string;
+    apiKey: string;
+    movies: RadarrMovie[];
+  }): Promise<void> {
+    const { baseUrl, apiKey, movies } = params;
+    await this.radarr
+      .setMoviesMonitoredWithFallback({
+        baseUrl,
+        apiKey,
+        movies,
+        monitored: false,
+      })
+      .catch(() => undefined);
+  }
+
   private async resolveRadarrDefaults(params: {
     baseUrl: string;
     apiKey: string;
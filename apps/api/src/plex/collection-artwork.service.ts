@@ -350,6 +350,14 @@ function parseOverrideValue(raw: string): CollectionArtworkOverrideMeta | null {
 
 @Injectable()
 export class CollectionArtworkService {
+  // Bundled default artwork never changes while the server runs, so the asset
+  // directory and each artwork's resolved files are probed once per process.
+  private assetsDir: string | null | undefined;
+  private readonly defaultArtworkPaths = new Map<
+    string,
+    { poster: string | null; background: string | null }
+  >();
+
   constructor(
     private readonly prisma: PrismaService,
     private readonly settingsService: SettingsService,
@@ -697,9 +705,7 @@ export class CollectionArtworkService {
       const oldAbsolute = this.resolveAbsolutePosterPath(
         parsedExisting.relativePosterPath,
       );
-      if (oldAbsolute && existsSync(oldAbsolute)) {
-        await unlink(oldAbsolute).catch(() => undefined);
-      }
+      if (oldAbsolute) await unlink(oldAbsolute).catch(() => undefined);
     }
 
     return override;
@@ -735,9 +741,16 @@ export class CollectionArtworkService {
     if (!parsed) return;
 
     const absolute = this.resolveAbsolutePosterPath(parsed.relativePosterPath);
-    if (!absolute || !existsSync(absolute)) return;
+    if (!absolute) return;
 
-    await unlink(absolute).catch(() => undefined);
+    // unlink doubles as the existence check: a missing poster means there is
+    // no per-target directory to clean up either.
+    try {
+      await unlink(absolute);
+    } catch (err) {
+      const code = (err as NodeJS.ErrnoException | undefined)?.code;
+      if (code === 'ENOENT') return;
+    }
     const parentDir = dirname(absolute);
     await rm(parentDir, { recursive: true, force: true }).catch(
       () => undefined,
@@ -1006,7 +1019,11 @@ export class CollectionArtworkService {
 
     if (!artworkName) return { poster: null, background: null };
 
-    const assetsDir = this.resolveAssetsDir();
+    const cached = this.defaultArtworkPaths.get(artworkName);
+    if (cached) return { ...cached };
+
+    if (this.assetsDir === undefined) this.assetsDir = this.resolveAssetsDir();
+    const assetsDir = this.assetsDir;
     if (!assetsDir) return { poster: null, background: null };
 
     const poster = this.resolveFirstExistingPath([
@@ -1021,6 +1038,7 @@ export class CollectionArtworkService {
       join(assetsDir, 'backgrounds', `${artworkName}.webp`),
     ]);
 
+    this.defaultArtworkPaths.set(artworkName, { poster, background });
     return { poster, background };
   }
 
@@ -104,4 +104,83 @@ describe('PlexServerService playable media verification', () => {
     expect(Array.from(result.verifiedEpisodes)).toEqual(['1:1']);
     expect(result.probeFailureCount).toBe(2);
   });
+
+  it('reads metadata details from a JSON response when Plex honours the Accept header', async () => {
+    fetchMock.mockResolvedValueOnce(
+      new Response(
+        JSON.stringify({
+          MediaContainer: {
+            size: 1,
+            Metadata: [
+              {
+                ratingKey: '42',
+                title: 'Json Movie',
+                type: 'movie',
+                year: 2020,
+                librarySectionID: 3,
+                librarySectionTitle: 'Movies',
+                Guid: [{ id: 'imdb://tt123' }, { id: 'tmdb://603' }],
+              },
+            ],
+          },
+        }),
+        { status: 200, headers: { 'Content-Type': 'application/json' } },
+      ),
+    );
+
+    const meta = await service.getMetadataDetails({
+      baseUrl: 'http://plex.local:32400',
+      token: 'plex-token',
+      ratingKey: '42',
+    });
+
+    const init = fetchMock.mock.calls[0]?.[1] as RequestInit;
+    expect((init.headers as Record<string, string>).Accept).toBe(
+      'application/json',
+    );
+    expect(meta?.title).toBe('Json Movie');
+    expect(meta?.tmdbIds).toEqual([603]);
+    expect(meta?.librarySectionId).toBe('3');
+  });
+
+  it('searches the full title result set and prefers an exact title match', async () => {
+    fetchMock.mockResolvedValueOnce(
+      new Response(
+        JSON.stringify({
+          MediaContainer: {
+            size: 2,
+            Metadata: [
+              { ratingKey: '7', title: '1917 Revisited' },
+              {
+                ratingKey: '8',
+                title: '1917',
+                year: 2019,
+                Guid: [{ id: 'imdb://tt8579674' }, { id: 'tmdb://530915' }],
+              },
+            ],
+          },
+        }),
+        { status: 200, headers: { 'Content-Type': 'application/json' } },
+      ),
+    );
+
+    const found = await service.findMovieRatingKeyByTitle({
+      baseUrl: 'http://plex.local:32400',
+      token: 'plex-token',
+      librarySectionKey: '1',
+      title: '1917',
+    });
+
+    const url = new URL(String(fetchMock.mock.calls[0]?.[0]));
+    expect(url.pathname).toBe('/library/sections/1/search');
+    expect(url.searchParams.get('query')).toBe('1917');
+    expect(url.searchParams.get('X-Plex-Container-Size')).toBeNull();
+    expect(url.searchParams.get('includeGuids')).toBe('1');
+    expect(found).toEqual({
+      ratingKey: '8',
+      title: '1917',
+      year: 2019,
+      tmdbIds: [530915],
+    });
+  });
 });
@@ -1,4 +1,5 @@
 import { BadGatewayException, Injectable, Logger } from '@nestjs/common';
+import { readFile } from 'node:fs/promises';
 import { XMLParser } from 'fast-xml-parser';
 import { normalizeCollectionTitle } from './plex-collections.utils';
 import { sanitizeUrlForLogs, truncateForLog } from '../log.utils';
@@ -138,6 +139,29 @@ const parser = new XMLParser({
   processEntities: false,
 });
 
+// Upper bound on simultaneous part probes against the Plex server for one show.
+const EPISODE_PROBE_CONCURRENCY = 6;
+
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next;
+      next += 1;
+      results[i] = await fn(items[i], i);
+    }
+  };
+  await Promise.all(
+    Array.from({ length: Math.min(limit, items.length) }, () => worker()),
+  );
+  return results;
+}
+
 function asArray<T>(value: T | T[] | undefined | null): T[] {
   if (!value) return [];
   return Array.isArray(value) ? value : [value];
@@ -918,7 +942,11 @@ export class PlexServerService {
     // Include GUIDs for tmdb/tvdb extraction (needed for Radarr/Sonarr mapping).
     url.searchParams.set('includeGuids', '1');
 
-    const xml = asPlexXml(await this.fetchXml(url.toString(), token, 20000));
+    // Plex serves JSON for this endpoint when asked; the shape matches what the XML parser
+    // produces (MediaContainer.Metadata[] with Guid/Media/Part arrays), so parsing stays the same.
+    const xml = asPlexXml(
+      await this.fetchXml(url.toString(), token, 20000, { preferJson: true }),
+    );
     const container = xml.MediaContainer;
     const items = asPlexMetadataArray(container);
     const item = items[0];
@@ -1202,6 +1230,7 @@ export class PlexServerService {
     const metadataEpisodes = new Set<string>();
     let probeFailureCount = 0;
 
+    const episodes: Array<{ key: string; item: PlexMetadata }> = [];
     for (const item of items) {
       const season = parseFiniteNumber(item.parentIndex);
       const episode = parseFiniteNumber(item.index);
@@ -1209,16 +1238,26 @@ export class PlexServerService {
 
       const key = `${season}:${episode}`;
       metadataEpisodes.add(key);
+      episodes.push({ key, item });
+    }
 
-      const verification = await this.verifyPlayableMediaVersions({
-        baseUrl,
-        token,
-        media: parsePlexMediaVersions(item.Media),
-        partProbeCache,
-      });
+    // Each episode's part probe is an independent request; run a few at a time and
+    // fold the results back in episode order.
+    const verifications = await mapWithConcurrency(
+      episodes,
+      EPISODE_PROBE_CONCURRENCY,
+      ({ item }) =>
+        this.verifyPlayableMediaVersions({
+          baseUrl,
+          token,
+          media: parsePlexMediaVersions(item.Media),
+          partProbeCache,
+        }),
+    );
+    for (const [i, verification] of verifications.entries()) {
       probeFailureCount += verification.probeFailureCount;
       if (verification.playable) {
-        verifiedEpisodes.add(key);
+        verifiedEpisodes.add(episodes[i].key);
       }
     }
 
@@ -1230,7 +1269,12 @@ export class PlexServerService {
     token: string;
     librarySectionKey: string;
     title: string;
-  }): Promise<{ ratingKey: string; title: string } | null> {
+  }): Promise<{
+    ratingKey: string;
+    title: string;
+    year: number | null;
+    tmdbIds: number[];
+  } | null> {
     const { baseUrl, token, librarySectionKey, title } = params;
     const q = title.trim();
     if (!q) return null;
@@ -1246,11 +1290,17 @@ export class PlexServerService {
     }
 
     const url = new URL(
-      `library/sections/${librarySectionKey}/search?type=1&query=${encodeURIComponent(q)}`,
+      `library/sections/${librarySectionKey}/search`,
       normalizeBaseUrl(baseUrl),
-    ).toString();
+    );
+    url.searchParams.set('type', '1');
+    url.searchParams.set('query', q);
+    // GUIDs come back inline, so callers get the TMDB id without a metadata round-trip.
+    url.searchParams.set('includeGuids', '1');
 
-    const xml = asPlexXml(await this.fetchXml(url, token, 20000));
+    const xml = asPlexXml(
+      await this.fetchXml(url.toString(), token, 20000, { preferJson: true }),
+    );
     const container = xml.MediaContainer;
     const items = asPlexMetadataArray(container);
 
@@ -1266,7 +1316,16 @@ export class PlexServerService {
     const ratingKey = best.ratingKey ? String(best.ratingKey) : '';
     const bestTitle = typeof best.title === 'string' ? best.title : q;
     if (!ratingKey) return null;
-    return { ratingKey, title: bestTitle };
+    const year =
+      typeof best.year === 'number' && Number.isFinite(best.year)
+        ? best.year
+        : null;
+    return {
+      ratingKey,
+      title: bestTitle,
+      year,
+      tmdbIds: extractIdsFromGuids(best.Guid, 'tmdb'),
+    };
   }
 
   async findShowRatingKeyByTitle(params: {
@@ -1280,11 +1339,15 @@ export class PlexServerService {
     if (!q) return null;
 
     const url = new URL(
-      `library/sections/${librarySectionKey}/search?type=2&query=${encodeURIComponent(q)}`,
+      `library/sections/${librarySectionKey}/search`,
       normalizeBaseUrl(baseUrl),
-    ).toString();
+    );
+    url.searchParams.set('type', '2');
+    url.searchParams.set('query', q);
 
-    const xml = asPlexXml(await this.fetchXml(url, token, 20000));
+    const xml = asPlexXml(
+      await this.fetchXml(url.toString(), token, 20000, { preferJson: true }),
+    );
     const container = xml.MediaContainer;
     const items = asPlexMetadataArray(container);
 
@@ -2881,7 +2944,6 @@ export class PlexServerService {
     filepath: string;
   }): Promise<void> {
     const { baseUrl, token, collectionRatingKey, filepath } = params;
-    const { readFile } = await import('node:fs/promises');
     const fileData = await readFile(filepath);
 
     const url = new URL(
@@ -2942,7 +3004,6 @@ export class PlexServerService {
     filepath: string;
   }): Promise<void> {
     const { baseUrl, token, collectionRatingKey, filepath } = params;
-    const { readFile } = await import('node:fs/promises');
     const fileData = await readFile(filepath);
 
     const url = new URL(
@@ -3174,6 +3235,7 @@ export class PlexServerService {
     url: string,
     token: string,
     timeoutMs: number,
+    options?: { preferJson?: boolean },
   ): Promise<unknown> {
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), timeoutMs);
@@ -3184,7 +3246,7 @@ export class PlexServerService {
       const res = await fetch(url, {
         method: 'GET',
         headers: {
-          Accept: 'application/xml',
+          Accept: options?.preferJson ? 'application/json' : 'application/xml',
           'X-Plex-Token': token,
         },
         signal: controller.signal,
@@ -3207,6 +3269,12 @@ export class PlexServerService {
           `Plex HTTP GET ${safeUrl} -> ${res.status} (${ms}ms)`,
         );
       }
+      // JSON.parse is much cheaper than the XML parser; fall back to XML when Plex ignores
+      // the Accept header (older servers / some endpoints).
+      const contentType = res.headers.get('content-type') ?? '';
+      if (options?.preferJson && contentType.includes('json')) {
+        return JSON.parse(text) as unknown;
+      }
       const parsed: unknown = parser.parse(text) as unknown;
       return parsed;
     } catch (err) {
@@ -1,5 +1,6 @@
 import {
   buildExcludedPlexUserIdsFromSelected,
+  isPlexAdminUser,
   isPlexUserExcludedFromMonitoring,
   readConfiguredExcludedPlexUserIds,
   resolvePlexUserMonitoringSelection,
@@ -83,4 +84,35 @@ describe('plex-user-selection.utils', () => {
       ).toBe(false);
     });
   });
+
+  describe('isPlexAdminUser', () => {
+    const admin = { id: 'a1', plexAccountId: 7, plexAccountTitle: 'Owner' };
+
+    it('matches the admin by id, account id, or account title', () => {
+      expect(
+        isPlexAdminUser(
+          { id: 'a1', plexAccountId: null, plexAccountTitle: '' },
+          admin,
+        ),
+      ).toBe(true);
+      expect(
+        isPlexAdminUser(
+          { id: 'u2', plexAccountId: 7, plexAccountTitle: 'Other' },
+          admin,
+        ),
+      ).toBe(true);
+      expect(
+        isPlexAdminUser(
+          { id: 'u3', plexAccountId: null, plexAccountTitle: ' owner ' },
+          admin,
+        ),
+      ).toBe(true);
+    });
+
+    it('falls back to the stored admin flag', () => {
+      const row = { id: 'u4', plexAccountId: 8, plexAccountTitle: 'Friend' };
+      expect(isPlexAdminUser(row, admin)).toBe(false);
+      expect(isPlexAdminUser({ ...row, isAdmin: true }, admin)).toBe(true);
+    });
+  });
 });
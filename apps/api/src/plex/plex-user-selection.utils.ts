@@ -83,3 +83,33 @@ export function isPlexUserExcludedFromMonitoring(params: {
     plexUserId,
   );
 }
+
+type PlexAdminIdentity = {
+  id: string;
+  plexAccountId: number | null;
+  plexAccountTitle: string;
+};
+
+function normalizeAccountTitle(value: string | null | undefined): string {
+  return String(value ?? '')
+    .trim()
+    .toLowerCase();
+}
+
+export function isPlexAdminUser(
+  row: PlexAdminIdentity & { isAdmin?: boolean },
+  admin: PlexAdminIdentity,
+): boolean {
+  if (row.id === admin.id) return true;
+  if (
+    row.plexAccountId !== null &&
+    admin.plexAccountId !== null &&
+    row.plexAccountId === admin.plexAccountId
+  ) {
+    return true;
+  }
+  const rowTitle = normalizeAccountTitle(row.plexAccountTitle);
+  const adminTitle = normalizeAccountTitle(admin.plexAccountTitle);
+  if (rowTitle && adminTitle && rowTitle === adminTitle) return true;
+  return row.isAdmin === true;
+}
@@ -0,0 +1,79 @@
+import { PlexWatchlistService } from './plex-watchlist.service';
+
+const WATCHLIST_XML = `<?xml version="1.0" encoding="UTF-8"?>
+<MediaContainer size="2">
+  <Video ratingKey="movie-1" title="First Movie" year="2020" type="movie" />
+  <Video ratingKey="movie-2" title="Second Movie" year="2021" type="movie" />
+</MediaContainer>`;
+
+function getRequestHeaders(
+  fetchMock: jest.SpiedFunction<typeof fetch>,
+  callIndex: number,
+): Record<string, string> {
+  const init = fetchMock.mock.calls[callIndex]?.[1];
+  return (init?.headers ?? {}) as Record<string, string>;
+}
+
+describe('PlexWatchlistService watchlist ETag cache', () => {
+  let service: PlexWatchlistService;
+  let fetchMock: jest.SpiedFunction<typeof fetch>;
+
+  beforeEach(() => {
+    service = new PlexWatchlistService();
+    fetchMock = jest.spyOn(globalThis, 'fetch');
+  });
+
+  afterEach(() => {
+    fetchMock.mockRestore();
+  });
+
+  it('serves an unchanged watchlist from cache on 304', async () => {
+    fetchMock
+      .mockResolvedValueOnce(
+        new Response(WATCHLIST_XML, {
+          status: 200,
+          headers: { ETag: '"v1"' },
+        }),
+      )
+      .mockResolvedValueOnce(new Response(null, { status: 304 }));
+
+    const first = await service.listWatchlist({ token: 't', kind: 'movie' });
+    const second = await service.listWatchlist({ token: 't', kind: 'movie' });
+
+    expect(getRequestHeaders(fetchMock, 1)['If-None-Match']).toBe('"v1"');
+    expect(second.items).toEqual(first.items);
+    expect(second.items).toHaveLength(2);
+  });
+
+  it('refetches the watchlist after a successful removal', async () => {
+    fetchMock
+      .mockResolvedValueOnce(
+        new Response(WATCHLIST_XML, {
+          status: 200,
+          headers: { ETag: '"v1"' },
+        }),
+      )
+      .mockResolvedValueOnce(new Response(null, { status: 200 }))
+      .mockResolvedValueOnce(
+        new Response(
+          `<?xml version="1.0" encoding="UTF-8"?>
+          <MediaContainer size="1">
+            <Video ratingKey="movie-2" title="Second Movie" year="2021" type="movie" />
+          </MediaContainer>`,
+          { status: 200, headers: { ETag: '"v1"' } },
+        ),
+      );
+
+    await service.listWatchlist({ token: 't', kind: 'movie' });
+    await expect(
+      service.removeFromWatchlistByRatingKey({
+        token: 't',
+        ratingKey: 'movie-1',
+      }),
+    ).resolves.toBe(true);
+    const after = await service.listWatchlist({ token: 't', kind: 'movie' });
+
+    expect(getRequestHeaders(fetchMock, 2)['If-None-Match']).toBeUndefined();
+    expect(after.items.map((it) => it.ratingKey)).toEqual(['movie-2']);
+  });
+});
@@ -65,45 +65,119 @@ function normalizeBaseUrl(baseUrl: string) {
   return baseUrl.endsWith('/') ? baseUrl : `${baseUrl}/`;
 }
 
+const NON_ALNUM_RE = /[^a-z0-9]/g;
+
 function normTitle(s: string): string {
   // Match Python helper: "".join(ch.lower() for ch in s if ch.isalnum())
-  return (s ?? '')
-    .toLowerCase()
-    .split('')
-    .filter((ch) => /[a-z0-9]/.test(ch))
-    .join('');
+  return (s ?? '').toLowerCase().replace(NON_ALNUM_RE, '');
+}
+
+function bigramCounts(s: string): Map<string, number> {
+  const map = new Map<string, number>();
+  for (let i = 0; i < s.length - 1; i += 1) {
+    const bg = s.slice(i, i + 2);
+    map.set(bg, (map.get(bg) ?? 0) + 1);
+  }
+  return map;
 }
 
-function diceCoefficient(a: string, b: string): number {
-  const s1 = normTitle(a);
-  const s2 = normTitle(b);
-  if (!s1 || !s2) return 0;
-  if (s1 === s2) return 1;
-  if (s1.length < 2 || s2.length < 2) return 0;
-
-  const bigrams = (s: string) => {
-    const map = new Map<string, number>();
-    for (let i = 0; i < s.length - 1; i += 1) {
-      const bg = s.slice(i, i + 2);
-      map.set(bg, (map.get(bg) ?? 0) + 1);
+/**
+ * Builds a Dice scorer for one query so its normalization and bigrams are computed
+ * once, not once per candidate. `floor` lets callers skip candidates whose length
+ * alone rules out beating the current best score.
+ */
+function diceScorer(
+  query: string,
+): (candidate: string, floor?: number) => number {
+  const s1 = normTitle(query);
+  const m1 = s1.length >= 2 ? bigramCounts(s1) : null;
+  return (candidate, floor = -1) => {
+    const s2 = normTitle(candidate);
+    if (!s1 || !s2) return 0;
+    if (s1 === s2) return 1;
+    if (!m1 || s2.length < 2) return 0;
+
+    const n1 = s1.length - 1;
+    const n2 = s2.length - 1;
+    if ((2 * Math.min(n1, n2)) / (n1 + n2) <= floor) return 0;
+
+    const m2 = bigramCounts(s2);
+    let intersection = 0;
+    for (const [bg, c1] of m1.entries()) {
+      const c2 = m2.get(bg) ?? 0;
+      intersection += Math.min(c1, c2);
     }
-    return map;
+    return (2 * intersection) / (n1 + n2);
   };
+}
+
+function preferFirst<T>(items: T[], isPreferred: (item: T) => boolean): T[] {
+  const preferred = items.filter(isPreferred);
+  if (!preferred.length) return items;
+  return [...preferred, ...items.filter((it) => !isPreferred(it))];
+}
+
+type WatchlistTitleGroups = {
+  byNorm: Map<string, PlexWatchlistEntry[]>;
+  byTitle: Map<string, PlexWatchlistEntry[]>;
+};
+
+// Keyed by the entries array, which listWatchlist reuses while Plex answers 304, so
+// titles of an unchanged watchlist are only normalized once.
+const titleGroupsCache = new WeakMap<
+  PlexWatchlistEntry[],
+  WatchlistTitleGroups
+>();
+
+function groupByTitle(items: PlexWatchlistEntry[]): WatchlistTitleGroups {
+  const cached = titleGroupsCache.get(items);
+  if (cached) return cached;
+
+  const byNorm = new Map<string, PlexWatchlistEntry[]>();
+  const byTitle = new Map<string, PlexWatchlistEntry[]>();
+  for (const it of items) {
+    const norm = normTitle(it.title);
+    const normGroup = byNorm.get(norm);
+    if (normGroup) normGroup.push(it);
+    else byNorm.set(norm, [it]);
+    const titleGroup = byTitle.get(it.title);
+    if (titleGroup) titleGroup.push(it);
+    else byTitle.set(it.title, [it]);
+  }
+  const groups = { byNorm, byTitle };
+  titleGroupsCache.set(items, groups);
+  return groups;
+}
 
-  const m1 = bigrams(s1);
-  const m2 = bigrams(s2);
-  let intersection = 0;
-  for (const [bg, c1] of m1.entries()) {
-    const c2 = m2.get(bg) ?? 0;
-    intersection += Math.min(c1, c2);
+function bestFuzzyTitle(
+  query: string,
+  titles: Iterable<string>,
+): { title: string; score: number } | null {
+  const score = diceScorer(query);
+  let best: { title: string; score: number } | null = null;
+  for (const title of titles) {
+    const value = score(title, best?.score);
+    if (!best || value > best.score) best = { title, score: value };
+    if (best.score === 1) break;
   }
-  return (2 * intersection) / (s1.length - 1 + (s2.length - 1));
+  return best;
 }
 
 @Injectable()
 export class PlexWatchlistService {
   private readonly logger = new Logger(PlexWatchlistService.name);
   private readonly clientIdentifier: string;
+  // Plex serves the watchlist from more than one host/endpoint shape. Remember the
+  // combination that last worked so later calls try it first instead of walking
+  // through known-bad attempts on every request.
+  private preferredListTarget: string | null = null;
+  private preferredRemoveTarget: string | null = null;
+  // Last watchlist response per URL+token. Plex sends an ETag for these lists, so an
+  // unchanged watchlist comes back as an empty 304 and is served from here.
+  private readonly watchlistEtagCache = new Map<
+    string,
+    { etag: string; items: PlexWatchlistEntry[] }
+  >();
 
   constructor() {
     // Keep consistent with PlexService: Plex expects a stable-ish identifier.
@@ -130,29 +204,51 @@ export class PlexWatchlistService {
 
     let lastErr: unknown = null;
 
-    for (const base of bases) {
-      for (const p of paths) {
-        const url = new URL(p, normalizeBaseUrl(base)).toString();
-        try {
-          const xml = asPlexXml(await this.fetchXml(url, token, 20000));
-          const container = xml.MediaContainer;
-          const items = asWatchlistItems(container);
-          const out: PlexWatchlistEntry[] = items
-            .map((it) => ({
-              ratingKey: it.ratingKey ? String(it.ratingKey) : '',
-              title: typeof it.title === 'string' ? it.title : '',
-              year: toInt(it.year),
-              type: typeof it.type === 'string' ? it.type : null,
-            }))
-            .filter((it) => it.ratingKey && it.title);
-
-          return { ok: true, baseUrl: base, items: out };
-        } catch (err) {
-          lastErr = err;
-          this.logger.debug(
-            `Watchlist fetch failed base=${base} path=${p}: ${(err as Error)?.message ?? String(err)}`,
-          );
+    const attempts = preferFirst(
+      bases.flatMap((base) =>
+        paths.map((p, i) => ({ base, p, target: `${base}#${i}` })),
+      ),
+      (a) => a.target === this.preferredListTarget,
+    );
+
+    for (const { base, p, target } of attempts) {
+      const url = new URL(p, normalizeBaseUrl(base)).toString();
+      const cacheKey = `${url}|${token}`;
+      const cached = this.watchlistEtagCache.get(cacheKey) ?? null;
+      try {
+        const res = await this.fetchXmlConditional(
+          url,
+          token,
+          20000,
+          cached?.etag ?? null,
+        );
+        if (res.notModified && cached) {
+          this.preferredListTarget = target;
+          return { ok: true, baseUrl: base, items: cached.items };
         }
+        const xml = asPlexXml(res.notModified ? null : res.body);
+        const container = xml.MediaContainer;
+        const items = asWatchlistItems(container);
+        const out: PlexWatchlistEntry[] = items
+          .map((it) => ({
+            ratingKey: it.ratingKey ? String(it.ratingKey) : '',
+            title: typeof it.title === 'string' ? it.title : '',
+            year: toInt(it.year),
+            type: typeof it.type === 'string' ? it.type : null,
+          }))
+          .filter((it) => it.ratingKey && it.title);
+
+        const etag = res.notModified ? null : res.etag;
+        if (etag) this.watchlistEtagCache.set(cacheKey, { etag, items: out });
+        else this.watchlistEtagCache.delete(cacheKey);
+
+        this.preferredListTarget = target;
+        return { ok: true, baseUrl: base, items: out };
+      } catch (err) {
+        lastErr = err;
+        this.logger.debug(
+          `Watchlist fetch failed base=${base} path=${p}: ${(err as Error)?.message ?? String(err)}`,
+        );
       }
     }
 
@@ -189,9 +285,8 @@ export class PlexWatchlistService {
 
     const wl = await this.listWatchlist({ token, kind: 'movie' });
 
-    const wantedNorm = normTitle(q);
-    const candidatesNorm = wl.items.filter((it) => {
-      if (normTitle(it.title) !== wantedNorm) return false;
+    const { byNorm, byTitle } = groupByTitle(wl.items);
+    const candidatesNorm = (byNorm.get(normTitle(q)) ?? []).filter((it) => {
       if (typeof year === 'number' && Number.isFinite(year)) {
         return it.year === year;
       }
@@ -204,13 +299,9 @@ export class PlexWatchlistService {
 
     if (candidates.length === 0) {
       // Fuzzy fallback (match Python's difflib.get_close_matches cutoff ~0.80)
-      let best: { item: PlexWatchlistEntry; score: number } | null = null;
-      for (const it of wl.items) {
-        const score = diceCoefficient(q, it.title);
-        if (!best || score > best.score) best = { item: it, score };
-      }
+      const best = bestFuzzyTitle(q, byTitle.keys());
       if (best && best.score >= 0.8) {
-        candidates = wl.items.filter((it) => it.title === best.item.title);
+        candidates = byTitle.get(best.title) ?? [];
         matchedBy = candidates.length > 0 ? 'fuzzy' : 'none';
       }
     }
@@ -262,23 +353,17 @@ export class PlexWatchlistService {
 
     const wl = await this.listWatchlist({ token, kind: 'show' });
 
-    const wantedNorm = normTitle(q);
-    const candidatesNorm = wl.items.filter(
-      (it) => normTitle(it.title) === wantedNorm,
-    );
+    const { byNorm, byTitle } = groupByTitle(wl.items);
+    const candidatesNorm = byNorm.get(normTitle(q)) ?? [];
 
     let candidates = candidatesNorm;
     let matchedBy: 'normalized' | 'fuzzy' | 'none' =
       candidatesNorm.length > 0 ? 'normalized' : 'none';
 
     if (candidates.length === 0) {
-      let best: { item: PlexWatchlistEntry; score: number } | null = null;
-      for (const it of wl.items) {
-        const score = diceCoefficient(q, it.title);
-        if (!best || score > best.score) best = { item: it, score };
-      }
+      const best = bestFuzzyTitle(q, byTitle.keys());
       if (best && best.score >= 0.8) {
-        candidates = wl.items.filter((it) => it.title === best.item.title);
+        candidates = byTitle.get(best.title) ?? [];
         matchedBy = candidates.length > 0 ? 'fuzzy' : 'none';
       }
     }
@@ -353,23 +438,40 @@ export class PlexWatchlistService {
       },
     ];
 
-    for (const base of bases) {
-      for (const c of candidates) {
-        const url = new URL(c.path, normalizeBaseUrl(base)).toString();
-        try {
-          const ok = await this.fetchNoContent(url, token, c.method, 15000);
-          if (ok) return true;
-        } catch (err) {
-          this.logger.debug(
-            `Watchlist remove failed ${c.method} ${sanitizeUrlForLogs(url)}: ${(err as Error)?.message ?? String(err)}`,
-          );
+    const attempts = preferFirst(
+      bases.flatMap((base) =>
+        candidates.map((c, i) => ({ base, c, target: `${base}#${i}` })),
+      ),
+      (a) => a.target === this.preferredRemoveTarget,
+    );
+
+    for (const { base, c, target } of attempts) {
+      const url = new URL(c.path, normalizeBaseUrl(base)).toString();
+      try {
+        const ok = await this.fetchNoContent(url, token, c.method, 15000);
+        if (ok) {
+          this.preferredRemoveTarget = target;
+          // Don't trust the ETag to rotate right away: the next list must refetch.
+          this.forgetCachedWatchlists(token);
+          return true;
         }
+      } catch (err) {
+        this.logger.debug(
+          `Watchlist remove failed ${c.method} ${sanitizeUrlForLogs(url)}: ${(err as Error)?.message ?? String(err)}`,
+        );
       }
     }
 
     return false;
   }
 
+  private forgetCachedWatchlists(token: string) {
+    const suffix = `|${token}`;
+    for (const key of this.watchlistEtagCache.keys()) {
+      if (key.endsWith(suffix)) this.watchlistEtagCache.delete(key);
+    }
+  }
+
   private getPlexHeaders(params: { token?: string }): Record<string, string> {
     // Match PlexService header set.
     return {
@@ -426,26 +528,43 @@ export class PlexWatchlistService {
     }
   }
 
-  private async fetchXml(
+  /**
+   * GET with an optional `If-None-Match`. A 304 means the cached copy for `etag` is
+   * still current, so the caller can skip both the download and the parse.
+   */
+  private async fetchXmlConditional(
     url: string,
     token: string,
     timeoutMs: number,
-  ): Promise<unknown> {
+    etag: string | null,
+  ): Promise<
+    | { notModified: true }
+    | { notModified: false; body: unknown; etag: string | null }
+  > {
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), timeoutMs);
     const safeUrl = sanitizeUrlForLogs(url);
     const startedAt = Date.now();
 
     try {
+      const headers: Record<string, string> = this.getPlexHeaders({ token });
+      if (etag) headers['If-None-Match'] = etag;
       const res = await fetch(url, {
         method: 'GET',
-        headers: this.getPlexHeaders({ token }),
+        headers,
         signal: controller.signal,
       });
 
       const text = await res.text().catch(() => '');
       const ms = Date.now() - startedAt;
 
+      if (etag && res.status === 304) {
+        this.logger.log(
+          `Plex watchlist HTTP GET ${safeUrl} -> 304 not modified (${ms}ms)`,
+        );
+        return { notModified: true };
+      }
+
       if (!res.ok) {
         this.logger.debug(
           `Plex watchlist HTTP GET ${safeUrl} -> ${res.status} (${ms}ms) ${text}`.trim(),
@@ -458,7 +577,11 @@ export class PlexWatchlistService {
       this.logger.log(
         `Plex watchlist HTTP GET ${safeUrl} -> ${res.status} (${ms}ms)`,
       );
-      return parser.parse(text) as unknown;
+      return {
+        notModified: false,
+        body: parser.parse(text) as unknown,
+        etag: res.headers.get('etag'),
+      };
     } catch (err) {
       if (err instanceof BadGatewayException) throw err;
       const ms = Date.now() - startedAt;
@@ -0,0 +1,204 @@
+import { RadarrService } from './radarr.service';
+
+type MockResponseInput = {
+  status: number;
+  text?: string;
+  json?: unknown;
+};
+
+function mockResponse(input: MockResponseInput): Response {
+  const { status } = input;
+  const textBody = input.text ?? '';
+  const jsonBody = input.json ?? {};
+
+  return {
+    ok: status >= 200 && status < 300,
+    status,
+    text: jest.fn().mockResolvedValue(textBody),
+    json: jest.fn().mockResolvedValue(jsonBody),
+    arrayBuffer: jest.fn().mockResolvedValue(new ArrayBuffer(0)),
+  } as unknown as Response;
+}
+
+describe('RadarrService', () => {
+  const fetchMock = jest.fn();
+  const baseUrl = 'http://localhost:7878';
+  const apiKey = 'secret';
+  let service: RadarrService;
+
+  beforeEach(() => {
+    fetchMock.mockReset();
+    (global as { fetch: typeof fetch }).fetch = fetchMock as never;
+    service = new RadarrService();
+  });
+
+  it('reuses a recently fetched movie list', async () => {
+    fetchMock.mockResolvedValue(
+      mockResponse({
+        status: 200,
+        json: [{ id: 1, title: 'The Matrix', tmdbId: 603, monitored: true }],
+      }),
+    );
+
+    const first = await service.listMovies({ baseUrl, apiKey });
+    const second = await service.listMovies({ baseUrl, apiKey });
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(second).toBe(first);
+  });
+
+  it('bypasses the movie list cache when fresh is requested', async () => {
+    fetchMock.mockResolvedValue(
+      mockResponse({ status: 200, json: [{ id: 1, title: 'The Matrix' }] }),
+    );
+
+    await service.listMovies({ baseUrl, apiKey });
+    await service.listMovies({ baseUrl, apiKey, fresh: true });
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('refetches the movie list after a monitor update', async () => {
+    const movie = { id: 1, title: 'The Matrix', tmdbId: 603, monitored: true };
+    fetchMock
+      .mockResolvedValueOnce(mockResponse({ status: 200, json: [movie] }))
+      .mockResolvedValueOnce(
+        mockResponse({ status: 200, json: { ...movie, monitored: false } }),
+      )
+      .mockResolvedValueOnce(
+        mockResponse({ status: 200, json: [{ ...movie, monitored: false }] }),
+      );
+
+    await service.listMovies({ baseUrl, apiKey });
+    await service.setMovieMonitored({
+      baseUrl,
+      apiKey,
+      movie,
+      monitored: false,
+    });
+    const after = await service.listMovies({ baseUrl, apiKey });
+
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+    expect(after[0]?.monitored).toBe(false);
+  });
+
+  it('shares one in-flight movie list fetch between concurrent callers', async () => {
+    fetchMock.mockResolvedValue(
+      mockResponse({ status: 200, json: [{ id: 1, title: 'The Matrix' }] }),
+    );
+
+    const [first, second] = await Promise.all([
+      service.listMovies({ baseUrl, apiKey }),
+      service.listMovies({ baseUrl, apiKey }),
+    ]);
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(second).toBe(first);
+  });
+
+  it('does not cache a movie list fetched before a monitor update', async () => {
+    const movie = { id: 1, title: 'The Matrix', tmdbId: 603, monitored: true };
+    let resolveList: (res: Response) => void = () => undefined;
+    fetchMock
+      .mockReturnValueOnce(
+        new Promise<Response>((resolve) => {
+          resolveList = resolve;
+        }),
+      )
+      .mockResolvedValueOnce(mockResponse({ status: 202, json: [] }))
+      .mockResolvedValueOnce(
+        mockResponse({ status: 200, json: [{ ...movie, monitored: false }] }),
+      );
+
+    const pending = service.listMovies({ baseUrl, apiKey });
+    await service.setMovieMonitored({
+      baseUrl,
+      apiKey,
+      movie,
+      monitored: false,
+    });
+    resolveList(mockResponse({ status: 200, json: [movie] }));
+    await pending;
+    const after = await service.listMovies({ baseUrl, apiKey });
+
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+    expect(after[0]?.monitored).toBe(false);
+  });
+
+  it('bulk-updates monitoring through the movie editor endpoint', async () => {
+    fetchMock.mockResolvedValueOnce(mockResponse({ status: 202, json: [] }));
+
+    const ok = await service.setMoviesMonitored({
+      baseUrl,
+      apiKey,
+      movieIds: [3, 1, 3],
+      monitored: false,
+    });
+
+    expect(ok).toBe(true);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock.mock.calls[0]?.[0]).toBe(
+      'http://localhost:7878/api/v3/movie/editor',
+    );
+    const init = fetchMock.mock.calls[0]?.[1] as RequestInit;
+    expect(init.method).toBe('PUT');
+    expect(JSON.parse(String(init.body))).toEqual({
+      movieIds: [3, 1],
+      monitored: false,
+    });
+  });
+
+  it('falls back to one full PUT per movie after a failed bulk editor call', async () => {
+    const movies = [
+      { id: 5, title: 'Heat', tmdbId: 949, monitored: true },
+      { id: 6, title: 'Ronin', tmdbId: 8195, monitored: true },
+    ];
+    fetchMock
+      .mockResolvedValueOnce(mockResponse({ status: 404, text: 'not found' }))
+      .mockResolvedValue(mockResponse({ status: 200, json: {} }));
+
+    await service.setMoviesMonitoredWithFallback({
+      baseUrl,
+      apiKey,
+      movies,
+      monitored: false,
+    });
+
+    expect(fetchMock.mock.calls.map((call) => call[0])).toEqual([
+      'http://localhost:7878/api/v3/movie/editor',
+      'http://localhost:7878/api/v3/movie/5',
+      'http://localhost:7878/api/v3/movie/6',
+    ]);
+  });
+
+  it('falls back to a full movie PUT when the editor endpoint fails', async () => {
+    const movie = { id: 5, title: 'Heat', tmdbId: 949, monitored: true };
+    fetchMock
+      .mockResolvedValueOnce(mockResponse({ status: 404, text: 'not found' }))
+      .mockResolvedValueOnce(
+        mockResponse({ status: 200, json: { ...movie, monitored: false } }),
+      );
+
+    const ok = await service.setMovieMonitored({
+      baseUrl,
+      apiKey,
+      movie,
+      monitored: false,
+    });
+
+    expect(ok).toBe(true);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(fetchMock.mock.calls[0]?.[0]).toBe(
+      'http://localhost:7878/api/v3/movie/editor',
+    );
+    expect(fetchMock.mock.calls[1]?.[0]).toBe(
+      'http://localhost:7878/api/v3/movie/5',
+    );
+    const init = fetchMock.mock.calls[1]?.[1] as RequestInit;
+    expect(JSON.parse(String(init.body))).toMatchObject({
+      id: 5,
+      title: 'Heat',
+      monitored: false,
+    });
+  });
+});
@@ -1,4 +1,5 @@
 import { BadGatewayException, Injectable, Logger } from '@nestjs/common';
+import { discardBody } from '../lib/http-body';
 import { truncateForLog } from '../log.utils';
 import { LOG_BODY_MAX_LENGTH } from '../app.constants';
 
@@ -25,9 +26,20 @@ export type RadarrTag = {
   label: string;
 };
 
+// Webhook bursts and back-to-back Observatory actions tend to ask for the full
+// movie list several times within seconds; keep the parsed list around briefly.
+const MOVIE_LIST_CACHE_TTL_MS = 60_000;
+
 @Injectable()
 export class RadarrService {
   private readonly logger = new Logger(RadarrService.name);
+  // Holds the fetch promise, so concurrent misses share one request. Writes bump the
+  // generation so a fetch that was already in flight is not cached afterwards.
+  private readonly movieListCache = new Map<
+    string,
+    { movies: Promise<readonly RadarrMovie[]>; expiresAt: number }
+  >();
+  private movieListGeneration = 0;
 
   async testConnection(params: { baseUrl: string; apiKey: string }) {
     const { baseUrl, apiKey } = params;
@@ -67,13 +79,56 @@ export class RadarrService {
     }
   }
 
+  /**
+   * Full Radarr movie list, served from a short-lived cache. The array is shared
+   * between callers (so per-list indexes built on top of it can be reused), hence
+   * readonly. Pass `fresh` when acting on `monitored` state: the cache only sees this
+   * process's own writes, not edits made in Radarr itself.
+   */
   async listMovies(params: {
     baseUrl: string;
     apiKey: string;
-  }): Promise<RadarrMovie[]> {
-    const { baseUrl, apiKey } = params;
+    fresh?: boolean;
+  }): Promise<readonly RadarrMovie[]> {
+    const { baseUrl, apiKey, fresh = false } = params;
     const url = this.buildApiUrl(baseUrl, 'api/v3/movie');
 
+    const cacheKey = `${url}|${apiKey}`;
+    const cached = fresh ? undefined : this.movieListCache.get(cacheKey);
+    if (cached && cached.expiresAt > Date.now()) return await cached.movies;
+
+    const generation = this.movieListGeneration;
+    const entry = {
+      movies: this.fetchMovieList(url, apiKey),
+      expiresAt: Number.POSITIVE_INFINITY,
+    };
+    this.movieListCache.set(cacheKey, entry);
+    try {
+      const movies = await entry.movies;
+      if (
+        generation === this.movieListGeneration &&
+        this.movieListCache.get(cacheKey) === entry
+      ) {
+        entry.expiresAt = Date.now() + MOVIE_LIST_CACHE_TTL_MS;
+      }
+      return movies;
+    } catch (err) {
+      if (this.movieListCache.get(cacheKey) === entry) {
+        this.movieListCache.delete(cacheKey);
+      }
+      throw err;
+    }
+  }
+
+  private invalidateMovieList() {
+    this.movieListGeneration += 1;
+    this.movieListCache.clear();
+  }
+
+  private async fetchMovieList(
+    url: string,
+    apiKey: string,
+  ): Promise<RadarrMovie[]> {
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), 20000);
 
@@ -155,6 +210,52 @@ export class RadarrService {
     }
   }
 
+  async getMovieByTmdbId(params: {
+    baseUrl: string;
+    apiKey: string;
+    tmdbId: number;
+  }): Promise<RadarrMovie | null> {
+    const { baseUrl, apiKey, tmdbId } = params;
+    // Radarr filters server-side on tmdbId, so this avoids pulling the full library list.
+    const url = this.buildApiUrl(
+      baseUrl,
+      `api/v3/movie?tmdbId=${encodeURIComponent(String(Math.trunc(tmdbId)))}`,
+    );
+
+    const controller = new AbortController();
+    const timeout = setTimeout(() => controller.abort(), 20000);
+
+    try {
+      const res = await fetch(url, {
+        method: 'GET',
+        headers: {
+          Accept: 'application/json',
+          'X-Api-Key': apiKey,
+        },
+        signal: controller.signal,
+      });
+
+      if (!res.ok) {
+        if (res.status === 404) return null;
+        const body = await res.text().catch(() => '');
+        throw new BadGatewayException(
+          `Radarr get movie by tmdbId failed: HTTP ${res.status} ${body}`.trim(),
+        );
+      }
+
+      const data = (await res.json()) as unknown;
+      const rows = Array.isArray(data) ? (data as RadarrMovie[]) : [];
+      return rows.find((m) => m?.tmdbId === Math.trunc(tmdbId)) ?? null;
+    } catch (err) {
+      if (err instanceof BadGatewayException) throw err;
+      throw new BadGatewayException(
+        `Radarr get movie by tmdbId failed: ${(err as Error)?.message ?? String(err)}`,
+      );
+    } finally {
+      clearTimeout(timeout);
+    }
+  }
+
   async setMovieMonitored(params: {
     baseUrl: string;
     apiKey: string;
@@ -168,6 +269,71 @@ export class RadarrService {
       return true;
     }
 
+    // Prefer the editor endpoint: it only needs the id + flag, so the (often large)
+    // movie object doesn't have to round-trip. Older/odd setups fall back to the
+    // full-object PUT below.
+    const viaEditor = await this.setMoviesMonitored({
+      baseUrl,
+      apiKey,
+      movieIds: [movie.id],
+      monitored,
+    }).catch((err) => {
+      this.logger.debug(
+        `Radarr editor update failed for movie ${movie.id}; retrying with full PUT: ${(err as Error)?.message ?? String(err)}`,
+      );
+      return false;
+    });
+    if (viaEditor) return true;
+
+    return await this.putMovieMonitored({ baseUrl, apiKey, movie, monitored });
+  }
+
+  /**
+   * Bulk monitor update through the movie editor. If the editor call fails, each movie
+   * is updated with a full-object PUT instead (without retrying the editor per movie).
+   * Best-effort: per-movie failures are logged and skipped.
+   */
+  async setMoviesMonitoredWithFallback(params: {
+    baseUrl: string;
+    apiKey: string;
+    movies: RadarrMovie[];
+    monitored: boolean;
+  }): Promise<void> {
+    const { baseUrl, apiKey, monitored } = params;
+    const movies = params.movies.filter((m) => m.monitored !== monitored);
+    if (!movies.length) return;
+
+    const bulkOk = await this.setMoviesMonitored({
+      baseUrl,
+      apiKey,
+      movieIds: movies.map((m) => m.id),
+      monitored,
+    }).catch((err) => {
+      this.logger.debug(
+        `Radarr editor update failed for ${movies.length} movies; retrying with full PUTs: ${(err as Error)?.message ?? String(err)}`,
+      );
+      return false;
+    });
+    if (bulkOk) return;
+
+    for (const movie of movies) {
+      await this.putMovieMonitored({ baseUrl, apiKey, movie, monitored }).catch(
+        (err) => {
+          this.logger.debug(
+            `Radarr update failed for movie ${movie.id}: ${(err as Error)?.message ?? String(err)}`,
+          );
+        },
+      );
+    }
+  }
+
+  private async putMovieMonitored(params: {
+    baseUrl: string;
+    apiKey: string;
+    movie: RadarrMovie;
+    monitored: boolean;
+  }): Promise<boolean> {
+    const { baseUrl, apiKey, movie, monitored } = params;
     const url = this.buildApiUrl(baseUrl, `api/v3/movie/${movie.id}`);
     const controller = new AbortController();
     const timeout = setTimeout(() => controller.abort(), 20000);
@@ -213,6 +379,8 @@ export class RadarrService {
         );
       }
 
+      await discardBody(res);
+      this.invalidateMovieList();
       return true;
     } catch (err) {
       if (err instanceof BadGatewayException) throw err;
@@ -224,6 +392,56 @@ export class RadarrService {
     }
   }
 
+  async setMoviesMonitored(params: {
+    baseUrl: string;
+    apiKey: string;
+    movieIds: number[];
+    monitored: boolean;
+  }): Promise<boolean> {
+    const { baseUrl, apiKey, monitored } = params;
+    const movieIds = Array.from(
+      new Set(params.movieIds.map((id) => Math.trunc(id))),
+    ).filter((id) => Number.isFinite(id) && id > 0);
+    if (!movieIds.length) return true;
+
+    const url = this.buildApiUrl(baseUrl, 'api/v3/movie/editor');
+    const controller = new AbortController();
+    const timeout = setTimeout(() => controller.abort(), 30000);
+
+    try {
+      // The editor endpoint only needs ids + the changed field, so one small request
+      // replaces a full-object PUT per movie.
+      const res = await fetch(url, {
+        method: 'PUT',
+        headers: {
+          Accept: 'application/json',
+          'Content-Type': 'application/json',
+          'X-Api-Key': apiKey,
+        },
+        body: JSON.stringify({ movieIds, monitored }),
+        signal: controller.signal,
+      });
+
+      if (!res.ok) {
+        const body = await res.text().catch(() => '');
+        throw new BadGatewayException(
+          `Radarr bulk update movies failed: HTTP ${res.status} ${body}`.trim(),
+        );
+      }
+
+      await discardBody(res);
+      this.invalidateMovieList();
+      return true;
+    } catch (err) {
+      if (err instanceof BadGatewayException) throw err;
+      throw new BadGatewayException(
+        `Radarr bulk update movies failed: ${(err as Error)?.message ?? String(err)}`,
+      );
+    } finally {
+      clearTimeout(timeout);
+    }
+  }
+
   async listRootFolders(params: {
     baseUrl: string;
     apiKey: string;
@@ -474,6 +692,7 @@ export class RadarrService {
       });
 
       if (res.ok) {
+        this.invalidateMovieList();
         const data = (await res.json().catch(() => null)) as unknown;
         return { status: 'added', movie: (data as RadarrMovie) ?? null };
       }
@@ -540,6 +759,7 @@ export class RadarrService {
         );
       }
 
+      await discardBody(res);
       return true;
     } catch (err) {
       if (err instanceof BadGatewayException) throw err;
@@ -1,4 +1,5 @@
 import { BadGatewayException, Injectable, Logger } from '@nestjs/common';
+import { discardBody } from '../lib/http-body';
 
 type SonarrSystemStatus = Record<string, unknown>;
 export type SonarrSeries = Record<string, unknown> & {
@@ -18,6 +19,16 @@ export type SonarrEpisode = Record<string, unknown> & {
   monitored?: boolean;
 };
 
+/** Non-2xx response from Sonarr, carrying the HTTP status for callers that branch on it. */
+export class SonarrHttpError extends BadGatewayException {
+  constructor(
+    message: string,
+    readonly status: number,
+  ) {
+    super(message);
+  }
+}
+
 export type SonarrRootFolder = {
   id: number;
   path: string;
@@ -122,15 +133,63 @@ export class SonarrService {
     return series.filter((s) => Boolean(s?.monitored));
   }
 
+  async getSeriesById(params: {
+    baseUrl: string;
+    apiKey: string;
+    seriesId: number;
+  }): Promise<SonarrSeries | null> {
+    const { baseUrl, apiKey, seriesId } = params;
+    const url = this.buildApiUrl(baseUrl, `api/v3/series/${seriesId}`);
+
+    const controller = new AbortController();
+    const timeout = setTimeout(() => controller.abort(), 20000);
+
+    try {
+      const res = await fetch(url, {
+        method: 'GET',
+        headers: {
+          Accept: 'application/json',
+          'X-Api-Key': apiKey,
+        },
+        signal: controller.signal,
+      });
+
+      if (!res.ok) {
+        if (res.status === 404) return null;
+        const body = await res.text().catch(() => '');
+        throw new BadGatewayException(
+          `Sonarr get series failed: HTTP ${res.status} ${body}`.trim(),
+        );
+      }
+
+      const data = (await res.json()) as unknown;
+      return data as SonarrSeries;
+    } catch (err) {
+      if (err instanceof BadGatewayException) throw err;
+      throw new BadGatewayException(
+        `Sonarr get series failed: ${(err as Error)?.message ?? String(err)}`,
+      );
+    } finally {
+      clearTimeout(timeout);
+    }
+  }
+
   async getEpisodesBySeries(params: {
     baseUrl: string;
     apiKey: string;
     seriesId: number;
+    seasonNumber?: number;
   }): Promise<SonarrEpisode[]> {
-    const { baseUrl, apiKey, seriesId } = params;
+    const { baseUrl, apiKey, seriesId, seasonNumber } = params;
+    // Sonarr can scope the episode list to one season server-side, which keeps
+    // the payload small for long-running shows.
+    const seasonQuery =
+      typeof seasonNumber === 'number' && Number.isFinite(seasonNumber)
+        ? `&seasonNumber=${Math.trunc(seasonNumber)}`
+        : '';
     const url = this.buildApiUrl(
       baseUrl,
-      `api/v3/episode?seriesId=${seriesId}`,
+      `api/v3/episode?seriesId=${seriesId}${seasonQuery}`,
     );
 
     const controller = new AbortController();
@@ -197,6 +256,7 @@ export class SonarrService {
         );
       }
 
+      await discardBody(res);
       return true;
     } catch (err) {
       if (err instanceof BadGatewayException) throw err;
@@ -208,6 +268,50 @@ export class SonarrService {
     }
   }
 
+  async setEpisodesMonitored(params: {
+    baseUrl: string;
+    apiKey: string;
+    episodeIds: number[];
+    monitored: boolean;
+  }): Promise<void> {
+    const { baseUrl, apiKey, episodeIds, monitored } = params;
+    if (!episodeIds.length) return;
+    const url = this.buildApiUrl(baseUrl, 'api/v3/episode/monitor');
+
+    const controller = new AbortController();
+    const timeout = setTimeout(() => controller.abort(), 30000);
+
+    try {
+      const res = await fetch(url, {
+        method: 'PUT',
+        headers: {
+          Accept: 'application/json',
+          'Content-Type': 'application/json',
+          'X-Api-Key': apiKey,
+        },
+        body: JSON.stringify({ episodeIds, monitored }),
+        signal: controller.signal,
+      });
+
+      if (!res.ok) {
+        const body = await res.text().catch(() => '');
+        throw new SonarrHttpError(
+          `Sonarr bulk update episodes failed: HTTP ${res.status} ${body}`.trim(),
+          res.status,
+        );
+      }
+
+      await discardBody(res);
+    } catch (err) {
+      if (err instanceof BadGatewayException) throw err;
+      throw new BadGatewayException(
+        `Sonarr bulk update episodes failed: ${(err as Error)?.message ?? String(err)}`,
+      );
+    } finally {
+      clearTimeout(timeout);
+    }
+  }
+
   async updateSeries(params: {
     baseUrl: string;
     apiKey: string;
@@ -238,6 +342,7 @@ export class SonarrService {
         );
       }
 
+      await discardBody(res);
       return true;
     } catch (err) {
       if (err instanceof BadGatewayException) throw err;
@@ -282,6 +387,7 @@ export class SonarrService {
         );
       }
 
+      await discardBody(res);
       return true;
     } catch (err) {
       if (err instanceof BadGatewayException) throw err;
@@ -217,61 +217,51 @@ export class WebhooksController {
     const mediaTypeLower = mediaType.toLowerCase();
 
     if (
+      payloadObj &&
       plexEvent === 'media.scrobble' &&
       (mediaTypeLower === 'movie' || mediaTypeLower === 'episode')
     ) {
-      const showTitle =
-        mediaTypeLower === 'episode' && payloadObj
-          ? pickString(payloadObj, 'Metadata.grandparentTitle')
-          : '';
-      const episodeTitle =
-        mediaTypeLower === 'episode' && payloadObj
-          ? pickString(payloadObj, 'Metadata.title')
-          : '';
+      const isEpisode = mediaTypeLower === 'episode';
+      const showTitle = isEpisode
+        ? pickString(payloadObj, 'Metadata.grandparentTitle')
+        : '';
+      const episodeTitle = isEpisode
+        ? pickString(payloadObj, 'Metadata.title')
+        : '';
 
       // For TV, we use the SHOW title as the seed (not the episode title).
-      const seedTitle =
-        mediaTypeLower === 'episode'
-          ? showTitle
-          : payloadObj
-            ? pickString(payloadObj, 'Metadata.title')
-            : '';
-
-      const seedRatingKey = payloadObj
-        ? pickString(payloadObj, 'Metadata.ratingKey')
+      const seedTitle = isEpisode
+        ? showTitle
+        : pickString(payloadObj, 'Metadata.title');
+
+      const seedRatingKey = pickString(payloadObj, 'Metadata.ratingKey');
+      const showRatingKey = isEpisode
+        ? pickString(payloadObj, 'Metadata.grandparentRatingKey')
         : '';
-      const showRatingKey =
-        mediaTypeLower === 'episode' && payloadObj
-          ? pickString(payloadObj, 'Metadata.grandparentRatingKey')
-          : '';
-      const seasonNumber =
-        mediaTypeLower === 'episode' && payloadObj
-          ? pickNumber(payloadObj, 'Metadata.parentIndex')
-          : null;
-      const episodeNumber =
-        mediaTypeLower === 'episode' && payloadObj
-          ? pickNumber(payloadObj, 'Metadata.index')
-          : null;
-
-      const seedYear =
-        mediaTypeLower === 'movie' && payloadObj
-          ? pickNumber(payloadObj, 'Metadata.year')
-          : null;
-      const seedLibrarySectionId = payloadObj
-        ? pickNumber(payloadObj, 'Metadata.librarySectionID')
+      const seasonNumber = isEpisode
+        ? pickNumber(payloadObj, 'Metadata.parentIndex')
         : null;
-      const seedLibrarySectionTitle = payloadObj
-        ? pickString(payloadObj, 'Metadata.librarySectionTitle')
-        : '';
-      const plexAccountId = payloadObj
-        ? pickNumber(payloadObj, 'Account.id')
+      const episodeNumber = isEpisode
+        ? pickNumber(payloadObj, 'Metadata.index')
         : null;
-      const plexAccountTitle = payloadObj
-        ? pickString(payloadObj, 'Account.title') ||
-          pickString(payloadObj, 'Account.name') ||
-          pickString(payloadObj, 'user') ||
-          pickString(payloadObj, 'owner')
-        : '';
+
+      const seedYear = isEpisode
+        ? null
+        : pickNumber(payloadObj, 'Metadata.year');
+      const seedLibrarySectionId = pickNumber(
+        payloadObj,
+        'Metadata.librarySectionID',
+      );
+      const seedLibrarySectionTitle = pickString(
+        payloadObj,
+        'Metadata.librarySectionTitle',
+      );
+      const plexAccountId = pickNumber(payloadObj, 'Account.id');
+      const plexAccountTitle =
+        pickString(payloadObj, 'Account.title') ||
+        pickString(payloadObj, 'Account.name') ||
+        pickString(payloadObj, 'user') ||
+        pickString(payloadObj, 'owner');
 
       if (seedTitle) {
         const userId = await this.authService.getFirstAdminUserId();
@@ -302,7 +292,7 @@ export class WebhooksController {
               seedRatingKey: seedRatingKey || null,
               seedLibrarySectionId: seedLibrarySectionId ?? null,
               seedLibrarySectionTitle: seedLibrarySectionTitle || null,
-              ...(mediaTypeLower === 'episode'
+              ...(isEpisode
                 ? {
                     showTitle: showTitle || null,
                     showRatingKey: showRatingKey || null,
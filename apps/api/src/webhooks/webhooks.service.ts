@@ -46,6 +46,7 @@ export class WebhooksService {
   private readonly logger = new Logger(WebhooksService.name);
   private readonly dedupStore = new Map<string, number>();
   private dedupLastCleanupMs = Date.now();
+  private plexWebhookDir: string | null = null;
   private readonly dedupWindowMs = parsePositiveInt(
     process.env.WEBHOOK_DEDUP_WINDOW_MS,
     WEBHOOK_DEDUP_DEFAULT_WINDOW_MS,
@@ -75,12 +76,26 @@ export class WebhooksService {
 
   async persistPlexWebhookEvent(event: unknown) {
     const baseDir = join(this.getDataDir(), 'webhooks', 'plex');
-    await fs.mkdir(baseDir, { recursive: true });
+    // Create the directory once per process instead of on every delivery.
+    if (this.plexWebhookDir !== baseDir) {
+      await fs.mkdir(baseDir, { recursive: true });
+      this.plexWebhookDir = baseDir;
+    }
 
     const filename = `${new Date().toISOString().replace(/[:.]/g, '-')}-${randomUUID()}.json`;
     const path = join(baseDir, filename);
 
-    await fs.writeFile(path, JSON.stringify(event, null, 2), 'utf8');
+    const body = JSON.stringify(event, null, 2);
+    try {
+      await fs.writeFile(path, body, 'utf8');
+    } catch (err) {
+      // The directory was removed while running; recreate it and retry once.
+      if ((err as NodeJS.ErrnoException | undefined)?.code !== 'ENOENT') {
+        throw err;
+      }
+      await fs.mkdir(baseDir, { recursive: true });
+      await fs.writeFile(path, body, 'utf8');
+    }
     this.logger.log(`Persisted Plex webhook event: ${path}`);
 
     return { path };
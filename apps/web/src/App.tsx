@@ -1,4 +1,4 @@
-import { useEffect } from 'react';
+import { lazy, useEffect } from 'react';
 import { BrowserRouter, Navigate, Outlet, Route, Routes, useLocation } from 'react-router-dom';
 
 import { AppShell } from '@/app/AppShell';
@@ -12,14 +12,25 @@ import { JobRunDetailPage } from '@/pages/JobRunDetailPage';
 import { NotFoundPage } from '@/pages/NotFoundPage';
 import { VaultPage } from '@/pages/VaultPage';
 import { CommandCenterPage } from '@/pages/CommandCenterPage';
-import { FaqPage } from '@/pages/FaqPage';
-import { SetupPage } from '@/pages/SetupPage';
-import { SetupTrueNasPage } from '@/pages/SetupTrueNasPage';
-import { SetupUnraidPage } from '@/pages/SetupUnraidPage';
-import { VersionHistoryPage } from '@/pages/VersionHistoryPage';
-import { DebuggerPage } from '@/pages/DebuggerPage';
 import { ProfilePage } from '@/pages/ProfilePage';
 
+// Reference and setup pages are rarely opened (the FAQ alone is ~3.4k lines), so
+// they are split out of the main bundle and only fetched when visited.
+const FaqPage = lazy(() => import('@/pages/FaqPage').then((m) => ({ default: m.FaqPage })));
+const SetupPage = lazy(() => import('@/pages/SetupPage').then((m) => ({ default: m.SetupPage })));
+const SetupTrueNasPage = lazy(() =>
+  import('@/pages/SetupTrueNasPage').then((m) => ({ default: m.SetupTrueNasPage })),
+);
+const SetupUnraidPage = lazy(() =>
+  import('@/pages/SetupUnraidPage').then((m) => ({ default: m.SetupUnraidPage })),
+);
+const VersionHistoryPage = lazy(() =>
+  import('@/pages/VersionHistoryPage').then((m) => ({ default: m.VersionHistoryPage })),
+);
+const DebuggerPage = lazy(() =>
+  import('@/pages/DebuggerPage').then((m) => ({ default: m.DebuggerPage })),
+);
+
 // skipcq: SCT-A000 - Legacy localStorage cleanup key, not a credential.
 const LEGACY_ONBOARDING_STORAGE_KEY = 'tcp_onboarding_v1';
 
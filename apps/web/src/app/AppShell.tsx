@@ -1,4 +1,5 @@
 import {
+  Suspense,
   useCallback,
   useEffect,
   useMemo,
@@ -386,7 +387,10 @@ export const AppShell = () => {
         {/* Force route content to remount on path change.
             This avoids rare cases where a previous page's state/overlays prevent the next page from rendering,
             even though the URL changes (observed leaving Observatory). */}
-        <Outlet key={location.pathname} />
+        {/* Some routes are lazy-loaded; keep the shell up while their chunk loads. */}
+        <Suspense fallback={null}>
+          <Outlet key={location.pathname} />
+        </Suspense>
       </main>
 
       {/* Mobile app navigation */}
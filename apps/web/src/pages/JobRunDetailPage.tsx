@@ -159,13 +159,17 @@ async function copyToClipboard(text: string) {
 }
 
 function buildJsonPreview(value: string, visibleLines: number): { text: string; truncated: boolean } {
-  const normalized = value.replace(/\r\n/g, '\n');
-  const lines = normalized.split('\n');
-  if (lines.length <= visibleLines) {
-    return { text: normalized, truncated: false };
+  // Only the first few lines are shown, so find where they end instead of splitting
+  // (and CRLF-normalizing) a serialized log dump that can run to megabytes.
+  let end = -1;
+  for (let i = 0; i < visibleLines; i += 1) {
+    end = value.indexOf('\n', end + 1);
+    if (end === -1) {
+      return { text: value.replace(/\r\n/g, '\n'), truncated: false };
+    }
   }
   return {
-    text: lines.slice(0, visibleLines).join('\n'),
+    text: value.slice(0, end).replace(/\r\n/g, '\n').replace(/\r$/, ''),
     truncated: true,
   };
 }
@@ -506,7 +510,7 @@ export function JobRunDetailPage() {
   }, [run?.summary]);
   const logInputContext = useMemo(() => {
     const logs = logsQuery.data?.logs ?? [];
-    const startLog = logs.find((l) => String(l.message ?? '') === 'run: started');
+    const startLog = logs.find((l) => l.message === 'run: started');
     if (!startLog || !isPlainObject(startLog.context)) return null;
     const ctxRaw = startLog.context as Record<string, unknown>;
     const inputRaw = ctxRaw['input'];
@@ -627,14 +631,18 @@ export function JobRunDetailPage() {
     );
   }, [reportV1, run?.jobId, shouldSortFactItems]);
   const logs = useMemo(() => logsQuery.data?.logs ?? [], [logsQuery.data?.logs]);
+  // The raw JSON (and its copy buttons) only exist while the raw response panel is
+  // open, so skip pretty-printing every log line on each poll while it is closed.
   const runSummaryJson = useMemo(() => {
+    if (!showRawResponse) return '';
     const serialized = JSON.stringify(run?.summary ?? null, null, 2);
     return typeof serialized === 'string' ? serialized : 'null';
-  }, [run?.summary]);
+  }, [run?.summary, showRawResponse]);
   const logsJson = useMemo(() => {
+    if (!showRawResponse) return '';
     const serialized = JSON.stringify(logs, null, 2);
     return typeof serialized === 'string' ? serialized : '[]';
-  }, [logs]);
+  }, [logs, showRawResponse]);
   const runSummaryJsonPreview = useMemo(
     () => buildJsonPreview(runSummaryJson, 3),
     [runSummaryJson],
@@ -1,5 +1,6 @@
 import {
   useCallback,
+  useEffect,
   useMemo,
   useState,
   type ChangeEvent,
@@ -9,7 +10,7 @@ import { motion, useAnimation } from 'motion/react';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { CircleAlert, Loader2, ScrollText, Trash2 } from 'lucide-react';
 
-import { clearServerLogs, listServerLogs } from '@/api/logs';
+import { clearServerLogs, listServerLogs, type ServerLogEntry } from '@/api/logs';
 import { ConfirmDialog } from '@/components/ConfirmDialog';
 import {
   APP_BG_DARK_WASH_CLASS,
@@ -98,6 +99,14 @@ const TYPE_TAG_CLASS: Record<Exclude<ServiceFilter, 'errors'>, string> = {
   openai: 'bg-purple-500/15 text-purple-100 border-purple-500/25',
 };
 
+// Full pill class per tag, joined once here instead of for every rendered row.
+const TYPE_TAG_PILL_CLASS = Object.fromEntries(
+  TYPE_TAG_ORDER.map((tag) => [
+    tag,
+    `inline-flex items-center rounded-full border px-2 py-0.5 text-[10px] font-semibold ${TYPE_TAG_CLASS[tag]}`,
+  ]),
+) as Record<Exclude<ServiceFilter, 'errors'>, string>;
+
 const TYPE_TAG_LABEL: Record<Exclude<ServiceFilter, 'errors'>, string> = {
   immaculaterr: 'Immaculaterr',
   task: 'Task',
@@ -109,106 +118,86 @@ const TYPE_TAG_LABEL: Record<Exclude<ServiceFilter, 'errors'>, string> = {
   openai: 'OpenAI',
 };
 
-const logMatchesTask = (line: {
-  message?: string;
-  context?: string | null;
-}) => {
-  const msg = String(line.message ?? '').toLowerCase();
-  const ctx = String(line.context ?? '').toLowerCase();
-  const hay = `${ctx} ${msg}`;
-
-  const jobContext =
-    ctx.includes('jobsservice') ||
-    ctx.includes('jobsscheduler') ||
-    ctx.includes('jobsretentionservice');
-  if (jobContext) return true;
-
-  const webhookAutomation =
-    ctx.includes('webhooksservice') &&
-    (msg.includes('plex automation:') ||
-      msg.includes('runs={') ||
-      msg.includes('skipped={') ||
-      msg.includes('errors={'));
-  if (webhookAutomation) return true;
-
-  return (
-    hay.includes('job started jobid=') ||
-    hay.includes('job passed jobid=') ||
-    hay.includes('job failed jobid=') ||
-    hay.includes('scheduled job failed') ||
-    hay.includes('skipping scheduled run') ||
-    hay.includes('trigger=schedule') ||
-    hay.includes('trigger=auto') ||
-    hay.includes('run: started') ||
-    hay.includes('run: finished') ||
-    hay.includes('run: failed')
-  );
-};
-
-const logMatchesAnyService = (line: {
-  message?: string;
-  context?: string | null;
-}) => {
-  const msg = String(line.message ?? '').toLowerCase();
-  const ctx = String(line.context ?? '').toLowerCase();
-  const hay = `${ctx} ${msg}`;
-  return (
-    logMatchesTask(line) ||
-    hay.includes('plex') ||
-    hay.includes('tmdb') ||
-    hay.includes('themoviedb') ||
-    hay.includes('radarr') ||
-    hay.includes('sonarr') ||
-    hay.includes('openai') ||
-    hay.includes('open ai') ||
-    hay.includes('google') ||
-    hay.includes('programmable search') ||
-    hay.includes('custom search') ||
-    hay.includes('cse')
-  );
+// Keyword sets are compiled once, so each line is scanned once per bucket instead of
+// once per keyword.
+const TASK_CONTEXT_RE = /jobsservice|jobsscheduler|jobsretentionservice/;
+const WEBHOOK_AUTOMATION_RE = /plex automation:|runs=\{|skipped=\{|errors=\{/;
+const TASK_MESSAGE_RE =
+  /job (?:started|passed|failed) jobid=|scheduled job failed|skipping scheduled run|trigger=(?:schedule|auto)|run: (?:started|finished|failed)/;
+const PLEX_MESSAGE_RE = /media\.scrobble|library\.new|webhook|notificationcontainer/;
+const TMDB_RE = /tmdb|themoviedb/;
+const GOOGLE_RE = /google|programmable search|custom search|cse/;
+const OPENAI_RE = /openai|open ai/;
+const ANY_SERVICE_RE =
+  /plex|tmdb|themoviedb|radarr|sonarr|openai|open ai|google|programmable search|custom search|cse/;
+
+// Takes the already-lowercased message and context.
+const logMatchesTask = (msg: string, ctx: string) => {
+  if (TASK_CONTEXT_RE.test(ctx)) return true;
+  if (ctx.includes('webhooksservice') && WEBHOOK_AUTOMATION_RE.test(msg)) return true;
+  return TASK_MESSAGE_RE.test(`${ctx} ${msg}`);
 };
 
-const serviceTagsForLine = (line: {
-  message?: string;
-  context?: string | null;
-  level?: string;
-}): Set<ServiceFilter> => {
+const computeServiceTags = (line: ServerLogEntry): Set<ServiceFilter> => {
   const out = new Set<ServiceFilter>();
-  const msg = String(line.message ?? '').toLowerCase();
-  const ctx = String(line.context ?? '').toLowerCase();
+  // The server types these fields (message is a string, level a lowercase union).
+  const msg = line.message.toLowerCase();
+  const ctx = (line.context ?? '').toLowerCase();
   const hay = `${ctx} ${msg}`;
 
-  if (String(line.level ?? '').toLowerCase() === 'error') out.add('errors');
-  if (logMatchesTask(line)) out.add('task');
-
-  if (
-    hay.includes('plex') ||
-    msg.includes('media.scrobble') ||
-    msg.includes('library.new') ||
-    msg.includes('webhook') ||
-    msg.includes('notificationcontainer')
-  ) {
-    out.add('plex');
-  }
-  if (hay.includes('tmdb') || hay.includes('themoviedb')) out.add('tmdb');
+  if (line.level === 'error') out.add('errors');
+  const isTask = logMatchesTask(msg, ctx);
+  if (isTask) out.add('task');
+
+  if (hay.includes('plex') || PLEX_MESSAGE_RE.test(msg)) out.add('plex');
+  if (TMDB_RE.test(hay)) out.add('tmdb');
   if (hay.includes('radarr')) out.add('radarr');
   if (hay.includes('sonarr')) out.add('sonarr');
-  if (
-    hay.includes('google') ||
-    hay.includes('programmable search') ||
-    hay.includes('custom search') ||
-    hay.includes('cse')
-  ) {
-    out.add('google');
-  }
-  if (hay.includes('openai') || hay.includes('open ai')) out.add('openai');
+  if (GOOGLE_RE.test(hay)) out.add('google');
+  if (OPENAI_RE.test(hay)) out.add('openai');
 
   // App-core bucket (Immaculaterr): anything not clearly attributable to an external service.
-  if (!logMatchesAnyService(line)) out.add('immaculaterr');
+  if (!isTask && !ANY_SERVICE_RE.test(hay)) out.add('immaculaterr');
 
   return out;
 };
 
+// Both the filter and the row renderer need a line's tags. Memoize them per log id:
+// once the server ring is full every poll shifts the array, so entry objects are not
+// reused across refetches, but ids are stable. The time guards against ids restarting
+// after a server restart.
+type LineTags = {
+  time: string;
+  set: Set<ServiceFilter>;
+  // Display order for the Type column, derived alongside the set.
+  ordered: Array<Exclude<ServiceFilter, 'errors'>>;
+};
+
+const serviceTagsCache = new Map<number, LineTags>();
+
+const serviceTagsForLine = (line: ServerLogEntry): LineTags => {
+  const cached = serviceTagsCache.get(line.id);
+  if (cached && cached.time === line.time) return cached;
+  const set = computeServiceTags(line);
+  const tags = { time: line.time, set, ordered: TYPE_TAG_ORDER.filter((tag) => set.has(tag)) };
+  serviceTagsCache.set(line.id, tags);
+  return tags;
+};
+
+// Drop cached tags for ids that are no longer in the fetched window so the cache stays
+// bounded by the server ring size.
+const pruneServiceTagsCache = (lines: ServerLogEntry[]) => {
+  if (!lines.length) {
+    serviceTagsCache.clear();
+    return;
+  }
+  const oldestId = lines[0].id;
+  const newestId = lines[lines.length - 1].id;
+  for (const id of serviceTagsCache.keys()) {
+    if (id < oldestId || id > newestId) serviceTagsCache.delete(id);
+  }
+};
+
 export const LogsPage = () => {
   const queryClient = useQueryClient();
   const titleIconControls = useAnimation();
@@ -224,27 +213,33 @@ export const LogsPage = () => {
     retry: false,
   });
 
-  const logs = useMemo(() => logsQuery.data?.logs ?? [], [logsQuery.data?.logs]);
+  // The server returns lines oldest first with increasing ids; flip them once per
+  // fetch so filtering (which preserves order) never has to sort again.
+  const logs = useMemo(
+    () => (logsQuery.data?.logs ?? []).slice().reverse(),
+    [logsQuery.data?.logs],
+  );
+  useEffect(() => {
+    pruneServiceTagsCache(logsQuery.data?.logs ?? []);
+  }, [logsQuery.data?.logs]);
   const filtered = useMemo(() => {
     const q = query.trim().toLowerCase();
     const byText = q
       ? logs.filter((l) => {
-          const msg = (l.message || '').toLowerCase();
+          const msg = l.message.toLowerCase();
           const ctx = (l.context || '').toLowerCase();
           return msg.includes(q) || ctx.includes(q);
         })
       : logs;
 
     const active = selected;
-    const scoped = !active.length
+    // Newest first, inherited from `logs`.
+    return !active.length
       ? byText
       : byText.filter((l) => {
-          const tags = serviceTagsForLine(l);
+          const tags = serviceTagsForLine(l).set;
           return active.some((f) => tags.has(f));
         });
-
-    // Newest first.
-    return [...scoped].sort((a, b) => b.id - a.id);
   }, [logs, query, selected]);
 
   const clearMutation = useMutation({
@@ -502,19 +497,13 @@ export const LogsPage = () => {
                             </td>
                             <td className="px-4 py-3 whitespace-nowrap">
                               {(() => {
-                                const tags = serviceTagsForLine(line);
-                                const orderedTypes = TYPE_TAG_ORDER.filter((tag) =>
-                                  tags.has(tag),
-                                );
+                                const orderedTypes = serviceTagsForLine(line).ordered;
                                 return (
                                   <div className="flex flex-wrap gap-1.5">
                                     {orderedTypes.map((tag) => (
                                       <span
                                         key={`${line.id}-${tag}`}
-                                        className={[
-                                          'inline-flex items-center rounded-full border px-2 py-0.5 text-[10px] font-semibold',
-                                          TYPE_TAG_CLASS[tag],
-                                        ].join(' ')}
+                                        className={TYPE_TAG_PILL_CLASS[tag]}
                                       >
                                         {TYPE_TAG_LABEL[tag]}
                                       </span>
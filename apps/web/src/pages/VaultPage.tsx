@@ -58,6 +58,30 @@ import { createPayloadEnvelope } from '@/lib/security/clientCredentialEnvelope';
 
 const MASKED_SECRET = '*******';
 
+type StatusPillVariant = 'inactive' | 'test' | 'testing' | 'active';
+
+// Every integration card renders one status pill on each render of this (large)
+// page, so the per-variant classes/labels are resolved once here.
+const STATUS_PILL_BASE_CLASS = `${APP_HEADER_STATUS_PILL_BASE_CLASS} justify-center transition-all duration-200 active:scale-95 disabled:opacity-60 disabled:cursor-not-allowed`;
+const STATUS_PILL_CLASS: Readonly<Record<StatusPillVariant, string>> = {
+  active: `${STATUS_PILL_BASE_CLASS} bg-emerald-500/90 text-white border-emerald-200/20 shadow-[0_16px_40px_-18px_rgba(16,185,129,0.75)]`,
+  test: `${STATUS_PILL_BASE_CLASS} bg-yellow-400/90 text-gray-900 border-yellow-200/25 shadow-[0_16px_40px_-18px_rgba(250,204,21,0.9)] hover:bg-yellow-300`,
+  testing: `${STATUS_PILL_BASE_CLASS} bg-yellow-400/60 text-gray-900 border-yellow-200/25`,
+  inactive: `${STATUS_PILL_BASE_CLASS} bg-white/10 text-white/70 border-white/15`,
+};
+const STATUS_LABEL: Readonly<Record<StatusPillVariant, string>> = {
+  active: 'Active',
+  test: 'Test',
+  testing: 'Testing',
+  inactive: 'Inactive',
+};
+const STATUS_DOT_CLASS: Readonly<Record<StatusPillVariant, string>> = {
+  active: 'bg-white/90',
+  test: 'bg-gray-900/70',
+  testing: 'bg-gray-900/70',
+  inactive: 'bg-white/35',
+};
+
 function isWebCryptoUnavailableError(error: unknown): boolean {
   const message = String((error as Error)?.message ?? '').toLowerCase();
   return message.includes('webcrypto is not available');
@@ -593,7 +617,6 @@ export const SettingsPage = ({
   // not by re-auto-enabling whenever secrets exist.
 
   type TestMode = 'manual' | 'auto' | 'background';
-  type StatusPillVariant = 'inactive' | 'test' | 'testing' | 'active';
 
   // UI state for service connectivity status pills
   const [plexTouched, setPlexTouched] = useState(false);
@@ -2292,47 +2315,6 @@ export const SettingsPage = ({
       enabled ? 'translate-x-6' : 'translate-x-1'
     }`;
 
-  const statusPillBaseClass = `${APP_HEADER_STATUS_PILL_BASE_CLASS} justify-center transition-all duration-200 active:scale-95 disabled:opacity-60 disabled:cursor-not-allowed`;
-  const statusPillClass = (variant: StatusPillVariant) => {
-    switch (variant) {
-      case 'active':
-        return `${statusPillBaseClass} bg-emerald-500/90 text-white border-emerald-200/20 shadow-[0_16px_40px_-18px_rgba(16,185,129,0.75)]`;
-      case 'test':
-        return `${statusPillBaseClass} bg-yellow-400/90 text-gray-900 border-yellow-200/25 shadow-[0_16px_40px_-18px_rgba(250,204,21,0.9)] hover:bg-yellow-300`;
-      case 'testing':
-        return `${statusPillBaseClass} bg-yellow-400/60 text-gray-900 border-yellow-200/25`;
-      case 'inactive':
-      default:
-        return `${statusPillBaseClass} bg-white/10 text-white/70 border-white/15`;
-    }
-  };
-  const statusLabel = (variant: StatusPillVariant) => {
-    switch (variant) {
-      case 'active':
-        return 'Active';
-      case 'test':
-        return 'Test';
-      case 'testing':
-        return 'Testing';
-      case 'inactive':
-      default:
-        return 'Inactive';
-    }
-  };
-  const statusDotClass = (variant: StatusPillVariant) => {
-    switch (variant) {
-      case 'active':
-        return 'bg-white/90';
-      case 'test':
-        return 'bg-gray-900/70';
-      case 'testing':
-        return 'bg-gray-900/70';
-      case 'inactive':
-      default:
-        return 'bg-white/35';
-    }
-  };
-
   const plexNeedsTest =
     plexTouched || Boolean(plexToken.trim());
   const tmdbNeedsTest =
@@ -3001,15 +2983,15 @@ export const SettingsPage = ({
                     type="button"
                     disabled={plexStatus === 'testing' || (plexStatus === 'inactive' && plexTestOk !== false)}
                     onClick={handlePlexManualTest}
-                    className={statusPillClass(plexStatus)}
-                    aria-label={`Plex status: ${statusLabel(plexStatus)}`}
+                    className={STATUS_PILL_CLASS[plexStatus]}
+                    aria-label={`Plex status: ${STATUS_LABEL[plexStatus]}`}
                   >
                     {plexStatus === 'testing' ? (
                       <Loader2 className="h-4 w-4 animate-spin" />
                     ) : (
-                      <span className={`h-2 w-2 rounded-full ${statusDotClass(plexStatus)}`} />
+                      <span className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[plexStatus]}`} />
                     )}
-                    {statusLabel(plexStatus)}
+                    {STATUS_LABEL[plexStatus]}
                   </button>
                 </div>
                 <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
@@ -3095,15 +3077,15 @@ export const SettingsPage = ({
                     type="button"
                     disabled={tmdbStatus === 'testing' || (tmdbStatus === 'inactive' && tmdbTestOk !== false)}
                     onClick={handleTmdbManualTest}
-                    className={statusPillClass(tmdbStatus)}
-                    aria-label={`TMDB status: ${statusLabel(tmdbStatus)}`}
+                    className={STATUS_PILL_CLASS[tmdbStatus]}
+                    aria-label={`TMDB status: ${STATUS_LABEL[tmdbStatus]}`}
                   >
                     {tmdbStatus === 'testing' ? (
                       <Loader2 className="h-4 w-4 animate-spin" />
                     ) : (
-                      <span className={`h-2 w-2 rounded-full ${statusDotClass(tmdbStatus)}`} />
+                      <span className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[tmdbStatus]}`} />
                     )}
-                    {statusLabel(tmdbStatus)}
+                    {STATUS_LABEL[tmdbStatus]}
                   </button>
                 </div>
                 <div className="grid grid-cols-1 gap-6">
@@ -3195,15 +3177,15 @@ export const SettingsPage = ({
                         (radarrStatus === 'inactive' && radarrTestOk !== false)
                       }
                       onClick={handleRadarrManualTest}
-                      className={statusPillClass(radarrStatus)}
-                      aria-label={`Radarr status: ${statusLabel(radarrStatus)}`}
+                      className={STATUS_PILL_CLASS[radarrStatus]}
+                      aria-label={`Radarr status: ${STATUS_LABEL[radarrStatus]}`}
                     >
                       {radarrStatus === 'testing' ? (
                         <Loader2 className="h-4 w-4 animate-spin" />
                       ) : (
-                        <span className={`h-2 w-2 rounded-full ${statusDotClass(radarrStatus)}`} />
+                        <span className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[radarrStatus]}`} />
                       )}
-                      {statusLabel(radarrStatus)}
+                      {STATUS_LABEL[radarrStatus]}
                     </button>
                     <button
                       type="button"
@@ -3316,17 +3298,17 @@ export const SettingsPage = ({
                                 onClick={() =>
                                   handleAdditionalArrInstanceManualTest(instance, displayEnabled)
                                 }
-                                className={statusPillClass(instanceStatus)}
-                                aria-label={`${instance.name} status: ${statusLabel(instanceStatus)}`}
+                                className={STATUS_PILL_CLASS[instanceStatus]}
+                                aria-label={`${instance.name} status: ${STATUS_LABEL[instanceStatus]}`}
                               >
                                 {instanceStatus === 'testing' ? (
                                   <Loader2 className="h-4 w-4 animate-spin" />
                                 ) : (
                                   <span
-                                    className={`h-2 w-2 rounded-full ${statusDotClass(instanceStatus)}`}
+                                    className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[instanceStatus]}`}
                                   />
                                 )}
-                                {statusLabel(instanceStatus)}
+                                {STATUS_LABEL[instanceStatus]}
                               </button>
                             </div>
                             <AnimatePresence initial={false}>
@@ -3586,15 +3568,15 @@ export const SettingsPage = ({
                         (sonarrStatus === 'inactive' && sonarrTestOk !== false)
                       }
                       onClick={handleSonarrManualTest}
-                      className={statusPillClass(sonarrStatus)}
-                      aria-label={`Sonarr status: ${statusLabel(sonarrStatus)}`}
+                      className={STATUS_PILL_CLASS[sonarrStatus]}
+                      aria-label={`Sonarr status: ${STATUS_LABEL[sonarrStatus]}`}
                     >
                       {sonarrStatus === 'testing' ? (
                         <Loader2 className="h-4 w-4 animate-spin" />
                       ) : (
-                        <span className={`h-2 w-2 rounded-full ${statusDotClass(sonarrStatus)}`} />
+                        <span className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[sonarrStatus]}`} />
                       )}
-                      {statusLabel(sonarrStatus)}
+                      {STATUS_LABEL[sonarrStatus]}
                     </button>
                     <button
                       type="button"
@@ -3707,17 +3689,17 @@ export const SettingsPage = ({
                                 onClick={() =>
                                   handleAdditionalArrInstanceManualTest(instance, displayEnabled)
                                 }
-                                className={statusPillClass(instanceStatus)}
-                                aria-label={`${instance.name} status: ${statusLabel(instanceStatus)}`}
+                                className={STATUS_PILL_CLASS[instanceStatus]}
+                                aria-label={`${instance.name} status: ${STATUS_LABEL[instanceStatus]}`}
                               >
                                 {instanceStatus === 'testing' ? (
                                   <Loader2 className="h-4 w-4 animate-spin" />
                                 ) : (
                                   <span
-                                    className={`h-2 w-2 rounded-full ${statusDotClass(instanceStatus)}`}
+                                    className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[instanceStatus]}`}
                                   />
                                 )}
-                                {statusLabel(instanceStatus)}
+                                {STATUS_LABEL[instanceStatus]}
                               </button>
                             </div>
                             <AnimatePresence initial={false}>
@@ -3977,17 +3959,17 @@ export const SettingsPage = ({
                           (seerrStatus === 'inactive' && seerrTestOk !== false)
                         }
                         onClick={handleSeerrManualTest}
-                        className={statusPillClass(seerrStatus)}
-                        aria-label={`Seerr status: ${statusLabel(seerrStatus)}`}
+                        className={STATUS_PILL_CLASS[seerrStatus]}
+                        aria-label={`Seerr status: ${STATUS_LABEL[seerrStatus]}`}
                       >
                         {seerrStatus === 'testing' ? (
                           <Loader2 className="h-4 w-4 animate-spin" />
                         ) : (
                           <span
-                            className={`h-2 w-2 rounded-full ${statusDotClass(seerrStatus)}`}
+                            className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[seerrStatus]}`}
                           />
                         )}
-                        {statusLabel(seerrStatus)}
+                        {STATUS_LABEL[seerrStatus]}
                       </button>
                       <button
                         type="button"
@@ -4104,15 +4086,15 @@ export const SettingsPage = ({
                         (googleStatus === 'inactive' && googleTestOk !== false)
                       }
                       onClick={handleGoogleManualTest}
-                      className={statusPillClass(googleStatus)}
-                      aria-label={`Google Search status: ${statusLabel(googleStatus)}`}
+                      className={STATUS_PILL_CLASS[googleStatus]}
+                      aria-label={`Google Search status: ${STATUS_LABEL[googleStatus]}`}
                     >
                       {googleStatus === 'testing' ? (
                         <Loader2 className="h-4 w-4 animate-spin" />
                       ) : (
-                        <span className={`h-2 w-2 rounded-full ${statusDotClass(googleStatus)}`} />
+                        <span className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[googleStatus]}`} />
                       )}
-                      {statusLabel(googleStatus)}
+                      {STATUS_LABEL[googleStatus]}
                     </button>
                     <button
                       type="button"
@@ -4227,15 +4209,15 @@ export const SettingsPage = ({
                         (openAiStatus === 'inactive' && openAiTestOk !== false)
                       }
                       onClick={handleOpenAiManualTest}
-                      className={statusPillClass(openAiStatus)}
-                      aria-label={`OpenAI status: ${statusLabel(openAiStatus)}`}
+                      className={STATUS_PILL_CLASS[openAiStatus]}
+                      aria-label={`OpenAI status: ${STATUS_LABEL[openAiStatus]}`}
                     >
                       {openAiStatus === 'testing' ? (
                         <Loader2 className="h-4 w-4 animate-spin" />
                       ) : (
-                        <span className={`h-2 w-2 rounded-full ${statusDotClass(openAiStatus)}`} />
+                        <span className={`h-2 w-2 rounded-full ${STATUS_DOT_CLASS[openAiStatus]}`} />
                       )}
-                      {statusLabel(openAiStatus)}
+                      {STATUS_LABEL[openAiStatus]}
                     </button>
                     <button
                       type="button"